@@ -0,0 +1,91 @@
+"""
+SEEKER Micro-Batching
+One worker task per batcher drains a queue of concurrent calls in small batches
+"""
+
+import asyncio
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class MicroBatcher(Generic[T]):
+    """
+    Base for batching concurrent calls made on one event loop.
+
+    _submit() queues an item with a future for its caller. A single worker
+    task collects up to max_batch items, waiting at most max_wait_ms after
+    the first one, and hands them to _process(), which resolves each
+    future. Subclasses implement _process(); close() stops the worker and
+    cancels the calls it had not answered.
+    """
+
+    def __init__(self, max_batch: int, max_wait_ms: float):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            # (Re)bind to the running loop, e.g. per test client or worker process
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _submit(self, item: T) -> Any:
+        """Queue an item and wait for the result _process() gives it"""
+        queue = self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((item, future))
+        return await future
+
+    async def close(self):
+        """Stop the worker task and cancel the calls it had not answered"""
+        worker, queue, loop = self._worker, self._queue, self._loop
+        self._worker = self._queue = self._loop = None
+        if worker is None:
+            return
+        worker.cancel()
+        if loop is asyncio.get_running_loop():
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        while not queue.empty():
+            _, future = queue.get_nowait()
+            future.cancel()
+
+    async def _collect(self, queue: asyncio.Queue) -> List[Tuple[T, asyncio.Future]]:
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _process(self, batch: List[Tuple[T, asyncio.Future]]):
+        """Resolve every still-pending future in the batch; must not raise"""
+        raise NotImplementedError
+
+    async def _run(self, queue: asyncio.Queue):
+        while True:
+            batch = await self._collect(queue)
+            try:
+                await self._process(batch)
+            except asyncio.CancelledError:
+                # Shutting down mid-batch; release the callers rather than strand them
+                for _, future in batch:
+                    future.cancel()
+                raise
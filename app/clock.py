@@ -0,0 +1,82 @@
+"""
+Cached wall-clock timestamps for SEEKER AI Orchestration System
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Any, Optional
+
+from pydantic import BeforeValidator, Field
+
+_UTC = timezone.utc
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+_ONE_MS = timedelta(milliseconds=1)
+
+def _to_epoch_ms(value: Any) -> Any:
+    """Accept the ISO-8601 strings and datetimes EpochMs fields serialize to"""
+    if isinstance(value, str) and not value.isdigit():
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            # Left for int validation to reject with its usual error
+            return value
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=_UTC)
+        return (value - _EPOCH) // _ONE_MS
+    return value
+
+# Milliseconds since the Unix epoch, for in-memory timestamps that are only
+# compared or ordered; rendered as ISO-8601 at the API boundary and read
+# back from it
+EpochMs = Annotated[int, BeforeValidator(_to_epoch_ms), Field(ge=0)]
+
+# UTC time and its ISO-8601 form, refreshed together by run_clock()
+_now = datetime.now(timezone.utc)
+_now_iso = _now.isoformat()
+# Set while run_clock() is refreshing the cache
+_clock_running = False
+
+def utc_now() -> datetime:
+    """Timezone-aware current UTC time, used as a model default_factory"""
+    return datetime.now(_UTC)
+
+def epoch_ms() -> int:
+    """Current time as integer milliseconds since the epoch"""
+    return time.time_ns() // 1_000_000
+
+def epoch_ms_iso(value: Optional[int]) -> Optional[str]:
+    """Render an EpochMs value as an ISO-8601 UTC timestamp"""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value / 1000, tz=_UTC).isoformat(timespec="milliseconds")
+
+def coarse_utc_now() -> datetime:
+    """Cached UTC time with one-second granularity, for telemetry-only defaults"""
+    if not _clock_running:
+        # Outside the app lifespan (scripts, tests) the cache would never advance
+        return datetime.now(_UTC)
+    return _now
+
+def now_iso() -> str:
+    """Current UTC timestamp with one-second granularity"""
+    if not _clock_running:
+        return datetime.now(_UTC).isoformat()
+    return _now_iso
+
+def precise_now_iso() -> str:
+    """Current UTC timestamp for callers that need sub-second precision"""
+    return datetime.now(timezone.utc).isoformat()
+
+async def run_clock(interval: float = 1.0):
+    """Refresh the cached timestamp every interval seconds until cancelled"""
+    global _now, _now_iso, _clock_running
+    _clock_running = True
+    try:
+        while True:
+            _now = datetime.now(timezone.utc)
+            _now_iso = _now.isoformat()
+            await asyncio.sleep(interval)
+    finally:
+        _clock_running = False
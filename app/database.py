@@ -2,33 +2,37 @@
 Database connection and utilities for SEEKER Global Analytics System
 """
 
+from fastapi import Request
 from motor.motor_asyncio import AsyncIOMotorClient
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Global MongoDB client
-_mongo_client = None
+MONGODB_URL = "mongodb://localhost:27017"
 
-def get_mongo_client() -> AsyncIOMotorClient:
-    """Get MongoDB client instance"""
-    global _mongo_client
-    
-    if _mongo_client is None:
-        try:
-            _mongo_client = AsyncIOMotorClient("mongodb://localhost:27017")
-            logger.info("✅ MongoDB client initialized")
-        except Exception as e:
-            logger.error(f"❌ Failed to initialize MongoDB client: {e}")
-            raise
-    
-    return _mongo_client
+# Connection pool settings shared by every consumer of the client
+MONGO_CLIENT_OPTIONS = {
+    "maxPoolSize": 50,
+    "minPoolSize": 10,
+    "serverSelectionTimeoutMS": 2000,
+    "connectTimeoutMS": 2000,
+    "socketTimeoutMS": 5000,
+    "uuidRepresentation": "standard",
+    "compressors": "zstd,zlib",
+}
 
-def close_mongo_client():
-    """Close MongoDB client connection"""
-    global _mongo_client
+def create_mongo_client() -> AsyncIOMotorClient:
+    """Create the MongoDB client; called once from the application lifespan"""
+    try:
+        client = AsyncIOMotorClient(MONGODB_URL, **MONGO_CLIENT_OPTIONS)
+        logger.info("✅ MongoDB client initialized")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize MongoDB client: {e}")
+        raise
     
-    if _mongo_client:
-        _mongo_client.close()
-        _mongo_client = None
-        logger.info("✅ MongoDB client connection closed") 
\ No newline at end of file
+    return client
+
+async def get_mongo_client(request: Request) -> AsyncIOMotorClient:
+    """Dependency returning the shared MongoDB client stored on app.state"""
+    # async so FastAPI resolves it on the event loop, not in the threadpool
+    return request.app.state.mongo
@@ -0,0 +1,37 @@
+"""
+Structured log formatting for SEEKER AI Orchestration System
+"""
+
+import logging
+from datetime import datetime, timezone
+
+import orjson
+
+# Attributes every LogRecord carries; anything else was passed via extra=
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+def _json_default(value):
+    if isinstance(value, bytes):
+        return value.decode("latin-1")
+    return str(value)
+
+class JSONLogFormatter(logging.Formatter):
+    """Render records as one orjson-encoded object per line
+
+    Fields passed through ``extra=`` are emitted as top-level keys, so hot
+    paths log a constant event name plus fields instead of building strings.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=_json_default).decode()
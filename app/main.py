@@ -5,16 +5,25 @@ On-demand global manufacturing connections
 AI-facilitated mass production scaling
 """
 
-from fastapi import FastAPI, Request, HTTPException, status
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, FastAPI, Request, HTTPException, status
+from fastapi.responses import HTMLResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
+import gzip
 import logging
+import orjson
+import os
+import queue
+import socket
 import time
-import uuid
-from datetime import datetime
-from motor.motor_asyncio import AsyncIOMotorClient
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import brotli
+except ImportError:
+    # brotli is optional; the root page is then served gzip-only
+    brotli = None
 
 # Import routes
 from app.routes.orchestration import router as orchestration_router
@@ -26,14 +35,31 @@ from app.routes.manufacturing import router as manufacturing_router
 from app.routes.printer import router as printer_router
 from app.routes.three_d_files import router as three_d_files_router
 from app.routes.holographic import router as holographic_router
-from app.routes.global_analytics import router as global_analytics_router
+from app.routes.global_analytics import close_analytics_service, router as global_analytics_router
 from app.routes.consumer_marketplace import router as consumer_marketplace_router
 from app.routes.global_shipping import router as global_shipping_router
 
-# Configure logging
+from app.clock import now_iso, run_clock
+from app.database import create_mongo_client
+from app.models.batch_ingress import user_request_batcher
+from app.services.global_analytics_service import ensure_analytics_indexes
+from app.responses import ORJSONResponse
+from app.log_format import JSONLogFormatter
+from app.profiling import PROFILING_ENABLED, ProfilingMiddleware
+from app.static_files import CachedStaticFiles
+
+# Configure logging - handlers run on a background listener so request
+# handling only pays for a queue put
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+for _handler in _root_logger.handlers:
+    _handler.setFormatter(JSONLogFormatter())
+log_listener = QueueListener(log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(log_queue)]
+
 # Global variables
 mongodb_client = None
 mongodb_database = None
@@ -44,20 +70,27 @@ async def lifespan(app: FastAPI):
     global mongodb_client, mongodb_database
     
     # Startup
+    log_listener.start()
+    clock_task = asyncio.create_task(run_clock())
     logger.info("🚀 Starting SEEKER AI Orchestration System...")
     
-    # Initialize MongoDB connection
+    # Initialize the one MongoDB client shared by every route
+    mongodb_client = create_mongo_client()
+    app.state.mongo = mongodb_client
     try:
-        mongodb_client = AsyncIOMotorClient("mongodb://localhost:27017")
         mongodb_database = mongodb_client.seeker_db
+        # Warm the pool so the first request doesn't pay the handshake
         await mongodb_client.admin.command('ping')
         logger.info("✅ MongoDB connected successfully to seeker_db")
+        try:
+            await ensure_analytics_indexes(mongodb_client)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not create analytics indexes: {e}")
         # Set MongoDB state for routes
         app.state.mongodb = mongodb_database
     except Exception as e:
         logger.error(f"❌ MongoDB connection failed: {e}")
         logger.info("⚠️ Running in demo mode without database")
-        mongodb_client = None
         mongodb_database = None
         # Set None state for routes
         app.state.mongodb = None
@@ -81,70 +114,130 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 Shutting down SEEKER system...")
-    if mongodb_client is not None:
-        mongodb_client.close()
-        logger.info("✅ MongoDB connection closed")
+    clock_task.cancel()
+    await user_request_batcher.close()
+    await close_analytics_service(mongodb_client)
+    mongodb_client.close()
+    logger.info("✅ MongoDB connection closed")
+    log_listener.stop()
+
+# Interactive docs and the OpenAPI schema are not generated in production
+_DOCS_ENABLED = os.getenv("SEEKER_ENV") != "prod"
 
 # Create FastAPI app
 app = FastAPI(
     title="SEEKER AI Orchestration System",
     description="AI-assisted product prototyping, global manufacturing connections, and mass production scaling",
     version="2.0.0",
+    default_response_class=ORJSONResponse,
+    docs_url="/docs" if _DOCS_ENABLED else None,
+    redoc_url="/redoc" if _DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if _DOCS_ENABLED else None,
     lifespan=lifespan
 )
 
-# Add CORS middleware
+# Add CORS middleware - explicit origins/methods/headers let Starlette use
+# precomputed headers instead of echoing each request back
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("SEEKER_CORS", "http://localhost:8000,http://127.0.0.1:8000").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization", "X-Request-Id"],
+    max_age=86400,
 )
 
 # Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
-
-# Include routers
-app.include_router(orchestration_router, prefix="/api/v1/orchestration")
-app.include_router(conversation_router, prefix="/api/v1")
-app.include_router(files_router, prefix="/api/v1")
-app.include_router(users_router, prefix="/api/v1")
-app.include_router(video_conference_router, prefix="/api/v1")
-app.include_router(manufacturing_router, prefix="/api/v1")
-app.include_router(printer_router, prefix="/api/v1")
-app.include_router(three_d_files_router, prefix="/api/v1")
-app.include_router(holographic_router, prefix="/api/v1")
-app.include_router(global_analytics_router, prefix="/api/v1")
-app.include_router(consumer_marketplace_router, prefix="/api/v1")
-app.include_router(global_shipping_router, prefix="/api/v1")
+app.mount("/static", CachedStaticFiles(directory="static", check_dir=False), name="static")
+
+# Include routers - routers without a version prefix of their own are
+# grouped once under /api/v1
+api_v1 = APIRouter(prefix="/api/v1")
+api_v1.include_router(orchestration_router, prefix="/orchestration")
+api_v1.include_router(conversation_router)
+api_v1.include_router(files_router)
+api_v1.include_router(users_router)
+api_v1.include_router(holographic_router)
+app.include_router(api_v1)
+
+# These routers already declare their full /api/v1/... prefix
+app.include_router(video_conference_router)
+app.include_router(manufacturing_router)
+app.include_router(printer_router)
+app.include_router(three_d_files_router)
+app.include_router(global_analytics_router)
+app.include_router(consumer_marketplace_router)
+app.include_router(global_shipping_router)
 
 # Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    request_id = str(uuid.uuid4())
-    start_time = time.time()
-    
-    logger.info(f"📥 {request.method} {request.url.path} - Request ID: {request_id}")
-    
-    try:
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        logger.info(f"📤 {request.method} {request.url.path} - {response.status_code} - {process_time:.3f}s")
-        
-        response.headers["x-request-id"] = request_id
-        response.headers["x-processing-time"] = str(process_time)
-        
-        return response
-    except Exception as e:
-        process_time = time.time() - start_time
-        logger.error(f"❌ {request.method} {request.url.path} - Error after {process_time:.3f}s: {e}")
-        raise
+# Probe endpoints polled by load balancers/orchestrators are not logged
+UNLOGGED_PATHS = frozenset({"/health", "/status", "/metrics", "/favicon.ico"})
+_INFO_ON = logger.isEnabledFor(logging.INFO)
+_API_NODE = socket.gethostname().encode()
 
-# Root endpoint - Serve the main interface
-@app.get("/", response_class=HTMLResponse)
-async def read_root():
-    return """
+class RequestLogMiddleware:
+    """Pure ASGI request logger - avoids the BaseHTTPMiddleware task/stream bridge"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in UNLOGGED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value
+                break
+        if request_id is None:
+            request_id = os.urandom(8).hex().encode()
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+
+        if _INFO_ON:
+            logger.info("request.start", extra={"method": method, "path": path, "rid": request_id})
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+                if _INFO_ON:
+                    logger.info("request.end", extra={
+                        "method": method, "path": path, "rid": request_id,
+                        "status": message["status"], "dur_ms": process_time * 1000.0,
+                    })
+                headers = list(message.get("headers", []))
+                headers.append((b"x-request-id", request_id))
+                headers.append((b"x-processing-time", f"{process_time:.3f}".encode()))
+                headers.append((b"x-api-node", _API_NODE))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            process_time = time.perf_counter() - start_time
+            logger.error("request.error", extra={
+                "method": method, "path": path, "rid": request_id,
+                "dur_ms": process_time * 1000.0, "error": repr(e),
+            })
+            raise
+
+app.add_middleware(RequestLogMiddleware)
+
+if PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# Root landing page, encoded once at import time
+_ROOT_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -248,15 +341,71 @@ async def read_root():
     </body>
     </html>
     """
+_ROOT_HTML_BYTES = _ROOT_HTML.encode("utf-8")
+_ROOT_HEADERS = {"cache-control": "public, max-age=3600", "vary": "accept-encoding"}
 
-# Health check endpoint
-@app.get("/health")
-async def health_check():
-    """Health check for the SEEKER system"""
+# Pre-compressed variants, most preferred first
+_ROOT_ENCODINGS = []
+if brotli is not None:
+    _ROOT_ENCODINGS.append(("br", brotli.compress(_ROOT_HTML_BYTES, quality=11)))
+_ROOT_ENCODINGS.append(("gzip", gzip.compress(_ROOT_HTML_BYTES, compresslevel=9)))
+
+# Root endpoint - Serve the main interface
+@app.get("/")
+async def read_root(request: Request):
+    # A fresh Response per call: downstream middleware (CORS) mutates the
+    # header list in place, so only the encoded body is shared
+    accepted = {
+        token.split(";", 1)[0].strip()
+        for token in request.headers.get("accept-encoding", "").split(",")
+    }
+    for encoding, body in _ROOT_ENCODINGS:
+        if encoding in accepted:
+            return HTMLResponse(body, headers={**_ROOT_HEADERS, "content-encoding": encoding})
+    return HTMLResponse(_ROOT_HTML_BYTES, headers=_ROOT_HEADERS)
+
+# Serialized /health and /status bodies, rebuilt at most once per second
+HEALTH_CACHE_TTL = 1.0
+_json_cache = {}
+
+async def _cached_json_body(key: str, build) -> bytes:
+    """Return the orjson-encoded result of build(), reusing it within the TTL"""
+    now = time.monotonic()
+    cached = _json_cache.get(key)
+    if cached is not None and now - cached[0] < HEALTH_CACHE_TTL:
+        return cached[1]
+    body = orjson.dumps(await build())
+    _json_cache[key] = (now, body)
+    return body
+
+# Active ping interval; between pings the driver's topology state is used
+DB_PING_INTERVAL = 30.0
+_last_db_ping = 0.0
+
+async def _database_reachable() -> bool:
+    """Read reachability from the driver's topology, pinging only periodically"""
+    global _last_db_ping
+    description = mongodb_client.topology_description
+    reachable = any(
+        server.is_writable or server.is_readable
+        for server in description.server_descriptions().values()
+    )
+    now = time.monotonic()
+    if now - _last_db_ping >= DB_PING_INTERVAL:
+        _last_db_ping = now
+        try:
+            await mongodb_client.admin.command('ping')
+            reachable = True
+        except Exception as e:
+            logger.error(f"Database health check failed: {e}")
+            reachable = False
+    return reachable
+
+async def _build_health_status():
     try:
         health_status = {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "version": "2.0.0",
             "services": {
                 "api": "healthy",
@@ -270,12 +419,9 @@ async def health_check():
         
         # Check database health
         if mongodb_client is not None and mongodb_database is not None:
-            try:
-                # Use the client instead of database for ping
-                await mongodb_client.admin.command('ping')
+            if await _database_reachable():
                 health_status["services"]["database"] = "healthy"
-            except Exception as e:
-                logger.error(f"Database health check failed: {e}")
+            else:
                 health_status["services"]["database"] = "unhealthy"
                 health_status["status"] = "degraded"
         else:
@@ -288,95 +434,102 @@ async def health_check():
         logger.error(f"Health check failed: {e}")
         return {
             "status": "unhealthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "error": str(e)
         }
 
+# Static portion of /status
+_SYSTEM_STATUS = {
+    "system": "SEEKER AI Orchestration System",
+    "version": "2.0.0",
+    "status": "operational",
+    "features": {
+        "voice_interface": {
+            "status": "active",
+            "languages": ["en-US", "es-ES", "fr-FR", "de-DE", "it-IT", "pt-BR", "ru-RU", "ja-JP", "ko-KR", "zh-CN"],
+            "capabilities": ["speech_recognition", "translation", "ai_classification"]
+        },
+        "video_conference": {
+            "status": "active",
+            "capabilities": ["webrtc", "real_time_translation", "collaboration"],
+            "max_participants": 10
+        },
+        "3d_visualization": {
+            "status": "active",
+            "capabilities": ["three_js", "collaborative_design", "ai_optimization"],
+            "export_formats": ["stl", "obj", "gltf"]
+        },
+        "manufacturing": {
+            "status": "active",
+            "capabilities": ["global_connections", "ai_optimization", "quality_control"],
+            "partners": ["shapeways", "3dhubs", "protolabs", "xometry"]
+        },
+        "3d_printer": {
+            "status": "active",
+            "capabilities": ["device_discovery", "real_time_monitoring", "print_control"],
+            "supported_protocols": ["usb", "serial", "network"]
+        }
+    },
+    "performance": {
+        "uptime": "99.9%",
+        "response_time": "0.8s",
+        "active_sessions": 0,
+        "total_requests": 0
+    }
+}
+
+async def _build_system_status():
+    return {**_SYSTEM_STATUS, "timestamp": now_iso()}
+
+# Health check endpoint
+@app.get("/health")
+async def health_check():
+    """Health check for the SEEKER system"""
+    return Response(await _cached_json_body("health", _build_health_status), media_type="application/json")
+
 # System status endpoint
 @app.get("/status")
 async def system_status():
     """Get detailed system status"""
     try:
-        status = {
-            "system": "SEEKER AI Orchestration System",
-            "version": "2.0.0",
-            "status": "operational",
-            "timestamp": datetime.utcnow().isoformat(),
-            "features": {
-                "voice_interface": {
-                    "status": "active",
-                    "languages": ["en-US", "es-ES", "fr-FR", "de-DE", "it-IT", "pt-BR", "ru-RU", "ja-JP", "ko-KR", "zh-CN"],
-                    "capabilities": ["speech_recognition", "translation", "ai_classification"]
-                },
-                "video_conference": {
-                    "status": "active",
-                    "capabilities": ["webrtc", "real_time_translation", "collaboration"],
-                    "max_participants": 10
-                },
-                "3d_visualization": {
-                    "status": "active",
-                    "capabilities": ["three_js", "collaborative_design", "ai_optimization"],
-                    "export_formats": ["stl", "obj", "gltf"]
-                },
-                "manufacturing": {
-                    "status": "active",
-                    "capabilities": ["global_connections", "ai_optimization", "quality_control"],
-                    "partners": ["shapeways", "3dhubs", "protolabs", "xometry"]
-                },
-                "3d_printer": {
-                    "status": "active",
-                    "capabilities": ["device_discovery", "real_time_monitoring", "print_control"],
-                    "supported_protocols": ["usb", "serial", "network"]
-                }
-            },
-            "performance": {
-                "uptime": "99.9%",
-                "response_time": "0.8s",
-                "active_sessions": 0,
-                "total_requests": 0
-            }
-        }
-        
-        return status
-        
+        return Response(await _cached_json_body("status", _build_system_status), media_type="application/json")
     except Exception as e:
         logger.error(f"Status check failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-# API documentation redirect
-@app.get("/docs")
-async def api_docs():
-    """Redirect to API documentation"""
-    return {"message": "API documentation available at /docs", "url": "/docs"}
-
-from fastapi.responses import JSONResponse
-
 # Error handlers
+# 404 body skeleton; only the path and cached timestamp are encoded per call
+_NOT_FOUND_TEMPLATE = b'{"error":"Not Found","message":"The requested resource was not found","path":%s,"timestamp":%s}'
+
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
-        status_code=404,
-        content={
-            "error": "Not Found",
-            "message": "The requested resource was not found",
-            "path": request.url.path,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-    )
+    body = _NOT_FOUND_TEMPLATE % (orjson.dumps(request.scope["path"]), orjson.dumps(now_iso()))
+    return Response(body, status_code=404, media_type="application/json")
 
 @app.exception_handler(500)
 async def internal_error_handler(request: Request, exc: HTTPException):
     logger.error(f"Internal server error: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
             "message": "An unexpected error occurred",
             "path": request.url.path,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso()
         }
     )
 
 if __name__ == "__main__":
     import uvicorn
-   
\ No newline at end of file
+
+    # loop="auto" resolves to uvloop where it is installed (not on Windows)
+    uvicorn.run(
+        "app.main:app",
+        host=os.getenv("SEEKER_HOST", "0.0.0.0"),
+        port=int(os.getenv("SEEKER_PORT", "8000")),
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="auto",
+        http="httptools",
+        log_config=None,
+        access_log=False,
+    )
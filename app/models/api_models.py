@@ -1,7 +1,30 @@
-from pydantic import BaseModel, Field, validator
-from typing import Dict, Any, Optional, List
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_serializer, field_validator
+from typing import Annotated, Dict, Any, Optional, List
 from datetime import datetime
 from enum import Enum
+import re
+import string
+
+from app.clock import utc_now
+
+# Characters allowed in user/device identifiers. Short IDs are checked with a
+# C-level set test; the compiled regex is faster for long strings.
+_ID_ALLOWED = frozenset(string.ascii_letters + string.digits + "_")
+_ID_RE = re.compile(r"\A[A-Za-z0-9_]+\Z")
+_ID_RE_MIN_LENGTH = 32
+
+def _is_valid_id(v: str) -> bool:
+    if len(v) >= _ID_RE_MIN_LENGTH:
+        return _ID_RE.match(v) is not None
+    return bool(v) and _ID_ALLOWED.issuperset(v)
+
+def _round3(v: float) -> float:
+    """Round a non-negative value to 3 decimals without float.__round__"""
+    return int(v * 1000.0 + 0.5) / 1000.0
+
+# Strings normalized by pydantic-core; length limits then apply to the
+# stripped value, so whitespace-only input fails min_length
+_StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
 
 class RequestStatus(str, Enum):
     """Enumeration for request processing status."""
@@ -11,6 +34,17 @@ class RequestStatus(str, Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
 
+_USER_REQUEST_EXAMPLE = {
+    "input_text": "Can you help me optimize this Python function for better performance?",
+    "user_id": "user_12345",
+    "device_id": "device_67890",
+    "context": {
+        "session_id": "sess_abc123",
+        "user_preferences": {"language": "en", "timezone": "UTC"},
+        "previous_requests": ["req_001", "req_002"]
+    }
+}
+
 class UserRequestModel(BaseModel):
     """
     Model for user request input to the SEEKER orchestration system.
@@ -19,7 +53,7 @@ class UserRequestModel(BaseModel):
     the input text and associated metadata for processing.
     """
     
-    input_text: str = Field(
+    input_text: _StrippedStr = Field(
         ...,
         min_length=1,
         max_length=10000,
@@ -45,40 +79,43 @@ class UserRequestModel(BaseModel):
     context: Optional[Dict[str, Any]] = Field(
         default=None,
         description="Optional context information for enhanced processing",
-        example={
-            "session_id": "sess_abc123",
-            "user_preferences": {"language": "en", "timezone": "UTC"},
-            "previous_requests": ["req_001", "req_002"]
-        }
+        example=_USER_REQUEST_EXAMPLE["context"]
     )
     
-    @validator('input_text')
-    def validate_input_text(cls, v):
-        """Validate that input text is not just whitespace."""
-        if not v.strip():
-            raise ValueError('Input text cannot be empty or only whitespace')
-        return v.strip()
-    
-    @validator('user_id')
+    @field_validator('user_id')
+    @classmethod
     def validate_user_id(cls, v):
         """Validate user ID format."""
-        if not v.isalnum() and '_' not in v:
+        if not _is_valid_id(v):
             raise ValueError('User ID must contain only alphanumeric characters and underscores')
         return v
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "input_text": "Can you help me optimize this Python function for better performance?",
-                "user_id": "user_12345",
-                "device_id": "device_67890",
-                "context": {
-                    "session_id": "sess_abc123",
-                    "user_preferences": {"language": "en", "timezone": "UTC"},
-                    "previous_requests": ["req_001", "req_002"]
-                }
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _USER_REQUEST_EXAMPLE},
+    )
+
+_PROCESSING_RESPONSE_EXAMPLE = {
+    "request_id": "req_abc123def456",
+    "status": "processing",
+    "classification_results": {
+        "technical": 0.85,
+        "strategic": 0.12,
+        "sensitive": 0.03,
+        "primary_category": "technical",
+        "confidence": 0.87
+    },
+    "routing_decision": {
+        "assigned_agents": ["technical_ai_agent"],
+        "routing_logic": "auto-route",
+        "primary_category": "technical",
+        "confidence": 0.87,
+        "estimated_processing_time": 3.5
+    },
+    "estimated_response_time": "3-5 seconds",
+    "confidence": 0.87,
+    "timestamp": "2024-01-15T10:30:00Z",
+    "message": "Request accepted and being processed"
+}
 
 class ProcessingResponseModel(BaseModel):
     """
@@ -103,29 +140,18 @@ class ProcessingResponseModel(BaseModel):
     classification_results: Dict[str, Any] = Field(
         ...,
         description="Results from the classification engine including category scores and confidence",
-        example={
-            "technical": 0.85,
-            "strategic": 0.12,
-            "sensitive": 0.03,
-            "primary_category": "technical",
-            "confidence": 0.87
-        }
+        example=_PROCESSING_RESPONSE_EXAMPLE["classification_results"]
     )
     
     routing_decision: Dict[str, Any] = Field(
         ...,
         description="Routing decision including assigned agents and logic",
-        example={
-            "assigned_agents": ["technical_ai_agent"],
-            "routing_logic": "auto-route",
-            "primary_category": "technical",
-            "confidence": 0.87,
-            "estimated_processing_time": 3.5
-        }
+        example=_PROCESSING_RESPONSE_EXAMPLE["routing_decision"]
     )
     
-    estimated_response_time: str = Field(
+    estimated_response_time: _StrippedStr = Field(
         ...,
+        min_length=1,
         description="Estimated time for complete response in human-readable format",
         example="3-5 seconds"
     )
@@ -139,7 +165,7 @@ class ProcessingResponseModel(BaseModel):
     )
     
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Timestamp when the processing response was generated"
     )
     
@@ -148,45 +174,46 @@ class ProcessingResponseModel(BaseModel):
         description="Human-readable message about the processing status"
     )
     
-    @validator('confidence')
-    def validate_confidence(cls, v):
-        """Validate confidence is within valid range."""
-        if not 0.0 <= v <= 1.0:
-            raise ValueError('Confidence must be between 0.0 and 1.0')
-        return round(v, 3)
-    
-    @validator('estimated_response_time')
-    def validate_response_time(cls, v):
-        """Validate response time format."""
-        if not v or len(v.strip()) == 0:
-            raise ValueError('Estimated response time cannot be empty')
-        return v.strip()
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "request_id": "req_abc123def456",
-                "status": "processing",
-                "classification_results": {
-                    "technical": 0.85,
-                    "strategic": 0.12,
-                    "sensitive": 0.03,
-                    "primary_category": "technical",
-                    "confidence": 0.87
-                },
-                "routing_decision": {
-                    "assigned_agents": ["technical_ai_agent"],
-                    "routing_logic": "auto-route",
-                    "primary_category": "technical",
-                    "confidence": 0.87,
-                    "estimated_processing_time": 3.5
-                },
-                "estimated_response_time": "3-5 seconds",
-                "confidence": 0.87,
-                "timestamp": "2024-01-15T10:30:00Z",
-                "message": "Request accepted and being processed"
-            }
-        }
+    @field_serializer('confidence')
+    def serialize_confidence(self, v: float) -> float:
+        """Round confidence once, at serialization; the range is checked by Field."""
+        return _round3(v)
+    
+    @classmethod
+    def build_trusted(cls, **fields) -> "ProcessingResponseModel":
+        """
+        Assemble a response from our own classifier and router output.
+        
+        Trusted because every value is produced in-process: validators are
+        skipped, so callers must pass an in-range confidence and a stripped
+        estimated_response_time.
+        """
+        return cls.model_construct(**fields)
+    
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
+        populate_by_name=True,
+        use_enum_values=True,
+        json_schema_extra={"example": _PROCESSING_RESPONSE_EXAMPLE},
+    )
+
+_AGENT_RESPONSE_EXAMPLE = {
+    "response_id": "resp_xyz789abc123",
+    "agent_id": "technical_ai_agent",
+    "response_content": "Based on your code analysis request, I've identified several optimization opportunities. The main bottleneck appears to be in the nested loop structure...",
+    "confidence": 0.92,
+    "processing_time": 2.34,
+    "agent_type": "technical",
+    "capabilities_used": ["code_analysis", "performance_optimization"],
+    "metadata": {
+        "model_version": "v2.1",
+        "tokens_used": 1500,
+        "temperature": 0.7
+    },
+    "timestamp": "2024-01-15T10:30:02Z"
+}
 
 class AgentResponseModel(BaseModel):
     """
@@ -208,7 +235,7 @@ class AgentResponseModel(BaseModel):
         example="technical_ai_agent"
     )
     
-    response_content: str = Field(
+    response_content: _StrippedStr = Field(
         ...,
         min_length=1,
         max_length=50000,
@@ -246,57 +273,44 @@ class AgentResponseModel(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(
         default=None,
         description="Additional metadata about the response",
-        example={
-            "model_version": "v2.1",
-            "tokens_used": 1500,
-            "temperature": 0.7
-        }
+        example=_AGENT_RESPONSE_EXAMPLE["metadata"]
     )
     
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Timestamp when the agent response was generated"
     )
     
-    @validator('confidence')
-    def validate_confidence(cls, v):
-        """Validate confidence is within valid range."""
-        if not 0.0 <= v <= 1.0:
-            raise ValueError('Confidence must be between 0.0 and 1.0')
-        return round(v, 3)
-    
-    @validator('processing_time')
-    def validate_processing_time(cls, v):
-        """Validate processing time is positive."""
-        if v < 0:
-            raise ValueError('Processing time must be non-negative')
-        return round(v, 3)
-    
-    @validator('response_content')
-    def validate_response_content(cls, v):
-        """Validate response content is not just whitespace."""
-        if not v.strip():
-            raise ValueError('Response content cannot be empty or only whitespace')
-        return v.strip()
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "response_id": "resp_xyz789abc123",
-                "agent_id": "technical_ai_agent",
-                "response_content": "Based on your code analysis request, I've identified several optimization opportunities. The main bottleneck appears to be in the nested loop structure...",
-                "confidence": 0.92,
-                "processing_time": 2.34,
-                "agent_type": "technical",
-                "capabilities_used": ["code_analysis", "performance_optimization"],
-                "metadata": {
-                    "model_version": "v2.1",
-                    "tokens_used": 1500,
-                    "temperature": 0.7
-                },
-                "timestamp": "2024-01-15T10:30:02Z"
-            }
+    @field_serializer('confidence', 'processing_time')
+    def serialize_metrics(self, v: float) -> float:
+        """Round metrics once, at serialization; the ranges are checked by Field."""
+        return _round3(v)
+    
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
+        populate_by_name=True,
+        json_schema_extra={"example": _AGENT_RESPONSE_EXAMPLE},
+    )
+
+_COMPLETE_RESPONSE_EXAMPLE = {
+    "request_id": "req_abc123def456",
+    "status": "completed",
+    "agent_responses": [
+        {
+            "response_id": "resp_xyz789abc123",
+            "agent_id": "technical_ai_agent",
+            "response_content": "Technical analysis completed...",
+            "confidence": 0.92,
+            "processing_time": 2.34
         }
+    ],
+    "total_processing_time": 4.67,
+    "average_confidence": 0.89,
+    "summary": "Technical analysis completed with high confidence.",
+    "timestamp": "2024-01-15T10:30:05Z"
+}
 
 class CompleteResponseModel(BaseModel):
     """
@@ -345,44 +359,30 @@ class CompleteResponseModel(BaseModel):
     )
     
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Timestamp when the complete response was assembled"
     )
     
-    @validator('average_confidence')
-    def validate_average_confidence(cls, v):
-        """Validate average confidence is within valid range."""
-        if not 0.0 <= v <= 1.0:
-            raise ValueError('Average confidence must be between 0.0 and 1.0')
-        return round(v, 3)
-    
-    @validator('total_processing_time')
-    def validate_total_processing_time(cls, v):
-        """Validate total processing time is positive."""
-        if v < 0:
-            raise ValueError('Total processing time must be non-negative')
-        return round(v, 3)
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "request_id": "req_abc123def456",
-                "status": "completed",
-                "agent_responses": [
-                    {
-                        "response_id": "resp_xyz789abc123",
-                        "agent_id": "technical_ai_agent",
-                        "response_content": "Technical analysis completed...",
-                        "confidence": 0.92,
-                        "processing_time": 2.34
-                    }
-                ],
-                "total_processing_time": 4.67,
-                "average_confidence": 0.89,
-                "summary": "Technical analysis completed with high confidence.",
-                "timestamp": "2024-01-15T10:30:05Z"
-            }
-        } 
+    @field_serializer('average_confidence', 'total_processing_time')
+    def serialize_metrics(self, v: float) -> float:
+        """Round aggregates once, at serialization; the ranges are checked by Field."""
+        return _round3(v)
+    
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
+        populate_by_name=True,
+        use_enum_values=True,
+        json_schema_extra={"example": _COMPLETE_RESPONSE_EXAMPLE},
+    )
+
+_RESPONSE_EXAMPLE = {
+    "success": True,
+    "message": "Operation completed successfully",
+    "data": {"result": "example_data"},
+    "timestamp": "2024-01-15T10:30:00Z"
+}
 
 class ResponseModel(BaseModel):
     """
@@ -404,16 +404,14 @@ class ResponseModel(BaseModel):
     )
     
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Timestamp when the response was generated"
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Operation completed successfully",
-                "data": {"result": "example_data"},
-                "timestamp": "2024-01-15T10:30:00Z"
-            }
-        } 
\ No newline at end of file
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
+        populate_by_name=True,
+        json_schema_extra={"example": _RESPONSE_EXAMPLE},
+    )
\ No newline at end of file
@@ -1,17 +1,43 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter, field_serializer, field_validator
+from typing import Deque, List, Optional
+from collections import deque
 from datetime import datetime
 
+from app.clock import EpochMs, epoch_ms, epoch_ms_iso, utc_now
+
+# Messages kept in memory per session; older ones are paged out to the archive
+RECENT_MESSAGE_WINDOW = 64
+
 class ConversationMessage(BaseModel):
     message_id: str = Field(..., description="Unique identifier for the message")
     user_input: str = Field(..., description="User's input message")
     system_response: str = Field(..., description="System's response to the user")
-    timestamp: datetime = Field(default_factory=datetime.now, description="When the message was created")
+    timestamp: EpochMs = Field(default_factory=epoch_ms, description="When the message was created (epoch milliseconds)")
+    
+    @field_serializer('timestamp', when_used='json')
+    def serialize_timestamp(self, v: int) -> str:
+        return epoch_ms_iso(v)
+
+# Shared validator for pages of messages, e.g. rows read back from the archive
+MESSAGE_LIST_ADAPTER = TypeAdapter(List[ConversationMessage])
 
 class ConversationSession(BaseModel):
     session_id: str = Field(..., description="Unique identifier for the conversation session")
     user_id: str = Field(..., description="ID of the user in the conversation")
-    messages: List[ConversationMessage] = Field(default_factory=list, description="List of messages in the conversation")
-    created_at: datetime = Field(default_factory=datetime.now, description="When the conversation was created")
-    last_activity: datetime = Field(default_factory=datetime.now, description="Last activity timestamp")
-    status: str = Field(default="active", description="Status of the conversation (active, closed, etc.)") 
\ No newline at end of file
+    recent_messages: Deque[ConversationMessage] = Field(
+        default_factory=lambda: deque(maxlen=RECENT_MESSAGE_WINDOW),
+        description="Most recent messages in the conversation (bounded window)"
+    )
+    message_count: int = Field(default=0, description="Total number of messages, including archived ones")
+    archive_ref: Optional[str] = Field(default=None, description="Location of archived older messages, if any")
+    created_at: datetime = Field(default_factory=utc_now, description="When the conversation was created")
+    last_activity: datetime = Field(default_factory=utc_now, description="Last activity timestamp")
+    status: str = Field(default="active", description="Status of the conversation (active, closed, etc.)")
+    
+    @field_validator('recent_messages')
+    @classmethod
+    def bound_recent_messages(cls, v):
+        """Keep validated windows bounded, as the message store expects."""
+        if v.maxlen != RECENT_MESSAGE_WINDOW:
+            v = deque(v, maxlen=RECENT_MESSAGE_WINDOW)
+        return v
\ No newline at end of file
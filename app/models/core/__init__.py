@@ -0,0 +1,322 @@
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from typing import Dict, Any, Optional, List
+from datetime import datetime
+from enum import Enum
+import numpy as np
+
+from app.clock import EpochMs, epoch_ms, epoch_ms_iso, utc_now
+# Validation helpers are shared with the API models rather than copied
+from app.models.api_models import RequestStatus, _StrippedStr, _is_valid_id, _round3
+from app.models.embedding import EmbeddingDtype, pack_embedding, unpack_embedding
+
+# Enums
+# RequestStatus is shared with the API models rather than redefined
+class AgentType(str, Enum):
+    """Enumeration for AI agent types."""
+    TECHNICAL = "technical"
+    STRATEGIC = "strategic"
+    SENSITIVE = "sensitive"
+    HUMAN = "human"
+
+# Core Models
+_USER_EXAMPLE = {
+    "user_id": "user_12345",
+    "personal_profile": {
+        "name": "John Doe",
+        "email": "john@example.com",
+        "preferences": {"language": "en", "timezone": "UTC"}
+    },
+    "device_registrations": [
+        {"device_id": "device_67890", "type": "laptop"}
+    ]
+}
+
+class User(BaseModel):
+    """
+    Core user model for the SEEKER system.
+    
+    Represents a user in the system with their profile and device registrations.
+    """
+    user_id: str = Field(
+        ..., 
+        min_length=1,
+        max_length=100,
+        description="Unique identifier for the user"
+    )
+    personal_profile: Dict[str, Any] = Field(
+        default_factory=dict, 
+        description="Personal profile information"
+    )
+    device_registrations: List[Dict[str, Any]] = Field(
+        default_factory=list, 
+        description="List of device registrations"
+    )
+    created_at: datetime = Field(
+        default_factory=utc_now, 
+        description="Timestamp of creation"
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None, 
+        description="Timestamp of last update"
+    )
+    
+    @field_validator('user_id')
+    @classmethod
+    def validate_user_id(cls, v):
+        """Validate user ID format."""
+        if not _is_valid_id(v):
+            raise ValueError('User ID must contain only alphanumeric characters and underscores')
+        return v
+    
+    model_config = ConfigDict(
+        # Not used on the request path; build the schema on first use
+        defer_build=True,
+        json_schema_extra={"example": _USER_EXAMPLE},
+    )
+
+_TASK_REQUEST_EXAMPLE = {
+    "request_id": "req_abc123def456",
+    "user_id": "user_12345",
+    "input_text": "Can you help me optimize this Python function for better performance?",
+    "classification_results": {
+        "technical": 0.85,
+        "strategic": 0.12,
+        "sensitive": 0.03
+    },
+    "routing_decision": "auto-route",
+    "status": "processing"
+}
+
+class Task_Request(BaseModel):
+    """
+    Core task request model for the SEEKER orchestration system.
+    
+    Represents a user's request that needs to be processed by AI agents.
+    """
+    request_id: str = Field(
+        ..., 
+        description="Unique identifier for the task request"
+    )
+    user_id: str = Field(
+        ..., 
+        description="ID of the user making the request"
+    )
+    input_text: Optional[_StrippedStr] = Field(
+        default=None, 
+        min_length=1,
+        max_length=10000,
+        description="Text input for the task request"
+    )
+    input_audio: Optional[bytes] = Field(
+        default=None, 
+        description="Audio input for the task request (as bytes)"
+    )
+    classification_results: Dict[str, Any] = Field(
+        default_factory=dict, 
+        description="Results from classification models"
+    )
+    routing_decision: Optional[str] = Field(
+        default=None, 
+        description="Routing decision for the request"
+    )
+    status: RequestStatus = Field(
+        default=RequestStatus.PENDING,
+        description="Current status of the request"
+    )
+    created_at: EpochMs = Field(
+        default_factory=epoch_ms, 
+        description="Timestamp of creation (epoch milliseconds)"
+    )
+    updated_at: Optional[EpochMs] = Field(
+        default=None,
+        description="Timestamp of last update (epoch milliseconds)"
+    )
+    
+    @field_serializer('created_at', 'updated_at', when_used='json')
+    def serialize_timestamps(self, v: Optional[int]) -> Optional[str]:
+        return epoch_ms_iso(v)
+    
+    model_config = ConfigDict(
+        # Not used on the request path; build the schema on first use
+        defer_build=True,
+        use_enum_values=True,
+        json_schema_extra={"example": _TASK_REQUEST_EXAMPLE},
+    )
+
+_AGENT_RESPONSE_EXAMPLE = {
+    "response_id": "resp_xyz789abc123",
+    "request_id": "req_abc123def456",
+    "agent_id": "technical_ai_agent",
+    "agent_type": "technical",
+    "response_content": "Based on your code analysis request, I've identified several optimization opportunities...",
+    "response_confidence": 0.92,
+    "processing_time": 2.34,
+    "metadata": {
+        "model_version": "v2.1",
+        "tokens_used": 1500
+    }
+}
+
+class Agent_Response(BaseModel):
+    """
+    Core agent response model for the SEEKER orchestration system.
+    
+    Represents a response from an AI agent to a task request.
+    """
+    response_id: str = Field(
+        ..., 
+        description="Unique identifier for the agent response"
+    )
+    request_id: str = Field(
+        ..., 
+        description="ID of the related task request"
+    )
+    agent_id: str = Field(
+        ..., 
+        description="ID of the responding agent"
+    )
+    agent_type: AgentType = Field(
+        ..., 
+        description="Type of the AI agent"
+    )
+    response_content: _StrippedStr = Field(
+        ..., 
+        min_length=1,
+        max_length=50000,
+        description="Content of the agent's response"
+    )
+    response_confidence: float = Field(
+        ..., 
+        ge=0.0,
+        le=1.0,
+        description="Confidence score of the response"
+    )
+    processing_time: float = Field(
+        ..., 
+        ge=0.0,
+        description="Time taken to process the request (in seconds)"
+    )
+    vector_embedding: bytes = Field(
+        default=b"", 
+        description="Vector embedding of the response as packed little-endian values"
+    )
+    embedding_dim: int = Field(
+        default=0,
+        ge=0,
+        description="Number of components in the vector embedding"
+    )
+    embedding_dtype: EmbeddingDtype = Field(
+        default="float16",
+        description="Element type of the packed vector embedding"
+    )
+    embedding_scale: float = Field(
+        default=1.0,
+        gt=0.0,
+        description="Dequantization scale for int8 embeddings"
+    )
+    metadata: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Additional metadata about the response"
+    )
+    created_at: EpochMs = Field(
+        default_factory=epoch_ms, 
+        description="Timestamp of creation (epoch milliseconds)"
+    )
+    
+    @field_serializer('response_confidence', 'processing_time')
+    def serialize_metrics(self, v: float) -> float:
+        """Round metrics once, at serialization; the ranges are checked by Field."""
+        return _round3(v)
+    
+    @field_serializer('created_at', when_used='json')
+    def serialize_created_at(self, v: int) -> str:
+        return epoch_ms_iso(v)
+    
+    @property
+    def embedding_array(self) -> np.ndarray:
+        """The embedding as a NumPy array; a read-only view unless int8-quantized."""
+        return unpack_embedding(self.vector_embedding, self.embedding_dtype, self.embedding_scale)
+    
+    @classmethod
+    def from_array(cls, embedding: np.ndarray, dtype: EmbeddingDtype = "float16", **fields) -> "Agent_Response":
+        """
+        Build a response around an embedding produced in-process.
+        
+        The array is packed once into little-endian bytes, int8 with a
+        symmetric scale; validators are skipped, so the remaining fields must
+        already be valid.
+        """
+        data, dim, scale = pack_embedding(embedding, dtype)
+        return cls.model_construct(
+            vector_embedding=data,
+            embedding_dim=dim,
+            embedding_dtype=dtype,
+            embedding_scale=scale,
+            **fields
+        )
+    
+    model_config = ConfigDict(
+        # Not used on the request path; build the schema on first use
+        defer_build=True,
+        # Packed embeddings travel as base64 in JSON
+        ser_json_bytes="base64",
+        val_json_bytes="base64",
+        use_enum_values=True,
+        json_schema_extra={"example": _AGENT_RESPONSE_EXAMPLE},
+    )
+
+_DEVICE_EXAMPLE = {
+    "device_id": "device_67890",
+    "user_id": "user_12345",
+    "device_type": "laptop",
+    "hardware_specs": {
+        "os": "Windows 11",
+        "cpu": "Intel i7",
+        "ram": "16GB"
+    }
+}
+
+class Device(BaseModel):
+    """
+    Core device model for the SEEKER system.
+    
+    Represents a device registered by a user in the system.
+    """
+    device_id: str = Field(
+        ..., 
+        description="Unique identifier for the device"
+    )
+    user_id: str = Field(
+        ..., 
+        description="ID of the user who owns the device"
+    )
+    device_type: str = Field(
+        ..., 
+        description="Type of the device (e.g., phone, tablet, laptop)"
+    )
+    hardware_specs: Dict[str, Any] = Field(
+        default_factory=dict, 
+        description="Hardware specifications of the device"
+    )
+    registration_date: datetime = Field(
+        default_factory=utc_now, 
+        description="Date the device was registered"
+    )
+    last_active: Optional[datetime] = Field(
+        default=None, 
+        description="Last active timestamp of the device"
+    )
+    
+    @field_validator('device_id')
+    @classmethod
+    def validate_device_id(cls, v):
+        """Validate device ID format."""
+        if not _is_valid_id(v):
+            raise ValueError('Device ID must contain only alphanumeric characters and underscores')
+        return v
+    
+    model_config = ConfigDict(
+        # Not used on the request path; build the schema on first use
+        defer_build=True,
+        json_schema_extra={"example": _DEVICE_EXAMPLE},
+    )
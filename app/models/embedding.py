@@ -0,0 +1,31 @@
+"""
+Packed vector embeddings shared by the SEEKER response models
+"""
+
+from typing import Literal, Tuple
+
+import numpy as np
+
+# Element types an embedding can be packed as; int8 is symmetrically
+# quantized and carries a scale to dequantize it
+EmbeddingDtype = Literal["float32", "float16", "int8"]
+
+def pack_embedding(embedding: np.ndarray, dtype: EmbeddingDtype = "float16") -> Tuple[bytes, int, float]:
+    """Pack an embedding into little-endian bytes; returns (bytes, dim, scale)"""
+    values = np.asarray(embedding, dtype=np.float32)
+    scale = 1.0
+    if dtype == "int8":
+        # Map the largest magnitude to 127 so values in [-1, 1] keep their
+        # resolution instead of truncating to 0
+        peak = float(np.abs(values).max()) if values.size else 0.0
+        scale = peak / 127 if peak else 1.0
+        values = np.rint(values / scale)
+    packed = np.ascontiguousarray(values, dtype=np.dtype(dtype).newbyteorder("<"))
+    return packed.tobytes(), packed.shape[0], scale
+
+def unpack_embedding(data: bytes, dtype: EmbeddingDtype, scale: float = 1.0) -> np.ndarray:
+    """Embedding as a NumPy array; a zero-copy view unless it was int8-quantized"""
+    packed = np.frombuffer(data, dtype=np.dtype(dtype).newbyteorder("<"))
+    if dtype == "int8":
+        return packed.astype(np.float32) * np.float32(scale)
+    return packed
@@ -43,11 +43,6 @@ class FileAttachment(BaseModel):
     is_public: bool = Field(default=False, description="Whether the file is publicly accessible")
     access_permissions: list[str] = Field(default_factory=list, description="List of user IDs with access")
     encryption_key: Optional[str] = Field(default=None, description="Encryption key if file is encrypted")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 class FileUploadRequest(BaseModel):
     """Request model for file uploads"""
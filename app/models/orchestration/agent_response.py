@@ -1,6 +1,9 @@
-from pydantic import BaseModel, Field
-from typing import Any, List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any
 from datetime import datetime
+import numpy as np
+
+from app.models.embedding import EmbeddingDtype, pack_embedding, unpack_embedding
 
 class Agent_Response(BaseModel):
     response_id: str = Field(..., description="Unique identifier for the agent response")
@@ -9,5 +12,36 @@ class Agent_Response(BaseModel):
     response_content: Any = Field(..., description="Content of the agent's response")
     response_confidence: float = Field(..., description="Confidence score of the response")
     processing_time: float = Field(..., description="Time taken to process the request (in seconds)")
-    vector_embedding: List[float] = Field(default_factory=list, description="Vector embedding of the response")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Timestamp of creation") 
\ No newline at end of file
+    vector_embedding: bytes = Field(default=b"", description="Vector embedding of the response as packed little-endian values")
+    embedding_dim: int = Field(default=0, ge=0, description="Number of components in the vector embedding")
+    embedding_dtype: EmbeddingDtype = Field(default="float16", description="Element type of the packed vector embedding")
+    embedding_scale: float = Field(default=1.0, gt=0.0, description="Dequantization scale for int8 embeddings")
+    created_at: datetime = Field(default_factory=datetime.utcnow, description="Timestamp of creation")
+
+    @property
+    def embedding_array(self) -> np.ndarray:
+        """The embedding as a NumPy array; a read-only view unless int8-quantized"""
+        return unpack_embedding(self.vector_embedding, self.embedding_dtype, self.embedding_scale)
+
+    @classmethod
+    def build_trusted(cls, **fields) -> "Agent_Response":
+        """Build from values produced in-process by an agent without re-validating them"""
+        return cls.model_construct(**fields)
+
+    @classmethod
+    def from_array(cls, embedding: np.ndarray, dtype: EmbeddingDtype = "float16", **fields) -> "Agent_Response":
+        """Pack an in-process embedding once and build the response around it"""
+        data, dim, scale = pack_embedding(embedding, dtype)
+        return cls.build_trusted(
+            vector_embedding=data,
+            embedding_dim=dim,
+            embedding_dtype=dtype,
+            embedding_scale=scale,
+            **fields
+        )
+
+    model_config = ConfigDict(
+        # Packed embeddings travel as base64 in JSON
+        ser_json_bytes="base64",
+        val_json_bytes="base64",
+    )
@@ -1,8 +1,29 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Literal, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
+from pydantic.dataclasses import dataclass
 from enum import Enum
-import uuid
+import os
+
+from app.clock import coarse_utc_now, utc_now
+
+# Random 128-bit identifiers rendered as 32 hex chars. They are drawn from
+# one os.urandom call per batch instead of one per object.
+_ID_BATCH_SIZE = 256
+_id_pool: List[str] = []
+
+
+def _new_id() -> str:
+    if not _id_pool:
+        raw = os.urandom(16 * _ID_BATCH_SIZE).hex()
+        _id_pool.extend(raw[i:i + 32] for i in range(0, len(raw), 32))
+    return _id_pool.pop()
+
+
+# Shared immutable defaults; pydantic copies mutable (list) defaults for
+# every instance but reuses hashable ones as-is
+_DEFAULT_LANGUAGES = ("en-US",)
+_DEFAULT_AUTO_TRANSLATION_LANGUAGES = ("en-US", "es-ES", "fr-FR", "de-DE", "zh-CN")
 
 
 class ParticipantRole(str, Enum):
@@ -32,9 +53,14 @@ class TranslationMode(str, Enum):
     OFF = "off"                    # No translation
 
 
+# Chat message kinds; a Literal validates with a set lookup and no enum
+# instance round trip on this per-message field
+ConferenceMessageType = Literal["text", "system", "translation"]
+
+
 class Participant(BaseModel):
     """Video conference participant model"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     name: str
     email: str
@@ -55,7 +81,7 @@ class Participant(BaseModel):
 
 class VideoConference(BaseModel):
     """Video conference room model"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     title: str
     description: Optional[str] = None
     host_id: str
@@ -65,26 +91,66 @@ class VideoConference(BaseModel):
     actual_start: Optional[datetime] = None
     actual_end: Optional[datetime] = None
     max_participants: int = 10
-    participants: List[Participant] = []
-    languages: List[str] = ["en-US"]
+    participants: List[Participant] = Field(default_factory=list)
+    languages: Tuple[str, ...] = _DEFAULT_LANGUAGES
     translation_enabled: bool = True
     recording_enabled: bool = False
     chat_enabled: bool = True
     screen_sharing_enabled: bool = True
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
     
     # SEEKER-specific fields
     negotiation_type: Optional[str] = None  # "price_negotiation", "contract_review", etc.
-    parties_involved: List[str] = []  # Company names or party identifiers
+    parties_involved: Tuple[str, ...] = ()  # Company names or party identifiers
     estimated_duration: Optional[int] = None  # minutes
     ai_facilitator_enabled: bool = True
-    auto_translation_languages: List[str] = ["en-US", "es-ES", "fr-FR", "de-DE", "zh-CN"]
+    auto_translation_languages: Tuple[str, ...] = _DEFAULT_AUTO_TRANSLATION_LANGUAGES
+
+    # Participant lookup index; the list stays the wire representation
+    _by_id: Dict[str, Participant] = PrivateAttr(default_factory=dict)
+    _indexed: Optional[List[Participant]] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._by_id = {p.id: p for p in self.participants}
+        self._indexed = self.participants
+
+    def get_participant(self, participant_id: str) -> Optional[Participant]:
+        """O(1) participant lookup by id"""
+        if self._indexed is not self.participants:
+            # The list was replaced wholesale; rebuild the index once
+            self._reindex()
+        return self._by_id.get(participant_id)
+
+    def add_participant(self, participant: Participant) -> None:
+        self.get_participant(participant.id)
+        self.participants.append(participant)
+        self._by_id[participant.id] = participant
+
+    def remove_participant(self, participant_id: str) -> Optional[Participant]:
+        participant = self.get_participant(participant_id)
+        if participant is not None:
+            self.participants.remove(participant)
+            del self._by_id[participant_id]
+        return participant
+
+    def update_speaking(self, participant_id: str, is_speaking: bool) -> bool:
+        participant = self.get_participant(participant_id)
+        if participant is None:
+            return False
+        participant.is_speaking = is_speaking
+        return True
 
 
-class ConferenceMessage(BaseModel):
+# Signaling and chat payloads are created per event; slotted pydantic
+# dataclasses keep the same validation without a per-instance __dict__
+@dataclass(slots=True, kw_only=True)
+class ConferenceMessage:
     """Chat message in video conference"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     conference_id: str
     sender_id: str
     sender_name: str
@@ -92,35 +158,38 @@ class ConferenceMessage(BaseModel):
     original_language: str
     translated_message: Optional[str] = None
     target_language: Optional[str] = None
-    message_type: str = "text"  # "text", "system", "translation"
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    message_type: ConferenceMessageType = "text"
+    timestamp: datetime = Field(default_factory=coarse_utc_now)
 
 
-class WebRTCOffer(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class WebRTCOffer:
     """WebRTC offer/answer signaling"""
     conference_id: str
     from_participant_id: str
     to_participant_id: str
     offer: Dict[str, Any]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=coarse_utc_now)
 
 
-class WebRTCAnswer(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class WebRTCAnswer:
     """WebRTC answer signaling"""
     conference_id: str
     from_participant_id: str
     to_participant_id: str
     answer: Dict[str, Any]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=coarse_utc_now)
 
 
-class ICECandidate(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ICECandidate:
     """WebRTC ICE candidate"""
     conference_id: str
     from_participant_id: str
     to_participant_id: str
     candidate: Dict[str, Any]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=coarse_utc_now)
 
 
 class TranslationRequest(BaseModel):
@@ -131,7 +200,7 @@ class TranslationRequest(BaseModel):
     source_language: str
     target_language: str
     translation_mode: TranslationMode
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=coarse_utc_now)
 
 
 class TranslationResponse(BaseModel):
@@ -144,7 +213,7 @@ class TranslationResponse(BaseModel):
     source_language: str
     target_language: str
     confidence: float
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=coarse_utc_now)
 
 
 class ConferenceCreateRequest(BaseModel):
@@ -154,11 +223,11 @@ class ConferenceCreateRequest(BaseModel):
     scheduled_start: datetime
     scheduled_end: Optional[datetime] = None
     max_participants: int = 10
-    languages: List[str] = ["en-US"]
+    languages: Tuple[str, ...] = _DEFAULT_LANGUAGES
     translation_enabled: bool = True
     recording_enabled: bool = False
     negotiation_type: Optional[str] = None
-    parties_involved: List[str] = []
+    parties_involved: Tuple[str, ...] = ()
     estimated_duration: Optional[int] = None
 
 
@@ -197,4 +266,4 @@ class ConferenceStats(BaseModel):
     recording_duration: Optional[int] = None
     average_connection_quality: float
     languages_used: List[str]
-    created_at: datetime = Field(default_factory=datetime.utcnow) 
\ No newline at end of file
+    created_at: datetime = Field(default_factory=coarse_utc_now) 
\ No newline at end of file
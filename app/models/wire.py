@@ -0,0 +1,55 @@
+"""
+Wire-level decoding for SEEKER ingress payloads
+
+Raw request bodies are decoded straight from bytes, skipping the stdlib
+json.loads pass FastAPI runs before Pydantic sees the payload. With msgspec
+installed the shape, types and length limits are checked by its C decoder;
+otherwise orjson parses the body and the Pydantic model checks everything.
+"""
+
+from typing import Annotated, Any, Dict, Optional
+
+import orjson
+
+from app.models.api_models import UserRequestModel
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+class WireDecodeError(ValueError):
+    """Raised when a request body cannot be decoded into its wire type"""
+
+    def __init__(self, msg: str, error_type: str = "value_error"):
+        super().__init__(msg)
+        self.msg = msg
+        self.error_type = error_type
+
+if msgspec is not None:
+    class UserRequestWire(msgspec.Struct, frozen=True):
+        """Wire shape of UserRequestModel; limits mirror its Field constraints"""
+        input_text: Annotated[str, msgspec.Meta(min_length=1, max_length=10000)]
+        user_id: Annotated[str, msgspec.Meta(min_length=1, max_length=100)]
+        device_id: Optional[Annotated[str, msgspec.Meta(max_length=100)]] = None
+        context: Optional[Dict[str, Any]] = None
+
+        def to_pydantic(self) -> UserRequestModel:
+            """Bridge into UserRequestModel, running its format validators"""
+            return UserRequestModel.model_validate(msgspec.structs.asdict(self))
+
+    _USER_REQUEST_DECODER = msgspec.json.Decoder(UserRequestWire)
+
+def decode_user_request(body: bytes) -> Dict[str, Any]:
+    """Decode a raw process-request body into a payload for UserRequestModel"""
+    if msgspec is not None:
+        try:
+            return msgspec.structs.asdict(_USER_REQUEST_DECODER.decode(body))
+        except msgspec.ValidationError as e:
+            raise WireDecodeError(str(e)) from e
+        except msgspec.DecodeError as e:
+            raise WireDecodeError(str(e), "json_invalid") from e
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise WireDecodeError(str(e), "json_invalid") from e
@@ -0,0 +1,65 @@
+"""
+Opt-in request profiling for SEEKER AI Orchestration System
+
+Enabled with SEEKER_PROFILING=1; only requests carrying ?profile=1 are
+profiled and answered with the profiler report instead of their normal body.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+
+try:
+    from pyinstrument import Profiler
+except ImportError:
+    # pyinstrument is optional; fall back to cProfile
+    Profiler = None
+
+PROFILING_ENABLED = os.getenv("SEEKER_PROFILING") == "1"
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware returning a pyinstrument (or cProfile) report"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or b"profile=1" not in scope["query_string"].split(b"&"):
+            await self.app(scope, receive, send)
+            return
+
+        async def discard_send(message):
+            # The profiled response is replaced by the report
+            pass
+
+        if Profiler is not None:
+            profiler = Profiler(async_mode="enabled")
+            profiler.start()
+            try:
+                await self.app(scope, receive, discard_send)
+            finally:
+                profiler.stop()
+            body = profiler.output_html().encode("utf-8")
+            content_type = b"text/html; charset=utf-8"
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, discard_send)
+            finally:
+                profiler.disable()
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(50)
+            body = report.getvalue().encode("utf-8")
+            content_type = b"text/plain; charset=utf-8"
+
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", content_type),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
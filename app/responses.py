@@ -0,0 +1,30 @@
+"""
+Response classes for SEEKER AI Orchestration System
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic_core import to_jsonable_python
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content the way ORJSONResponse renders it"""
+    return orjson.dumps(
+        content,
+        default=to_jsonable_python,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson
+
+    Mirrors fastapi.responses.ORJSONResponse, which newer FastAPI releases
+    deprecate, so the app keeps one import path across versions. Pydantic
+    models and other non-native values fall back to pydantic's encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
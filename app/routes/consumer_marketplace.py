@@ -5,20 +5,32 @@ Revolutionary consumer marketplace with complete price transparency
 
 from fastapi import APIRouter, HTTPException, Depends
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+import bisect
+from collections import defaultdict
 import logging
+from motor.motor_asyncio import AsyncIOMotorClient
 import numpy as np
 
 from app.services.consumer_marketplace_service import SEEKERConsumerMarketplace
 from app.database import get_mongo_client
+from app.clock import now_iso
+from app.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/consumer-marketplace", tags=["Consumer Marketplace"])
 
-def get_consumer_marketplace_service():
+# Insight bands: a value strictly above a threshold moves up one label
+_PRICE_SPREAD_BANDS = (0.5,)
+_PRICE_SPREAD_LABELS = ("Low", "High")
+_TRANSPARENCY_BANDS = (0.6, 0.8)
+_TRANSPARENCY_LABELS = ("Poor", "Good", "Excellent")
+
+def _band(value: float, bands: tuple, labels: tuple) -> str:
+    return labels[bisect.bisect_left(bands, value)]
+
+def get_consumer_marketplace_service(mongo_client: AsyncIOMotorClient = Depends(get_mongo_client)):
     """Dependency injection for Consumer Marketplace Service"""
-    mongo_client = get_mongo_client()
     return SEEKERConsumerMarketplace(mongo_client)
 
 @router.get("/product-comparison")
@@ -36,7 +48,7 @@ async def get_product_comparison(
         
         comparison = await marketplace_service.get_consumer_product_comparison(product_name, industry, category)
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": f"Consumer comparison generated for {product_name}",
             "data": {
@@ -49,9 +61,9 @@ async def get_product_comparison(
                 "best_value_supplier": comparison.best_value_supplier,
                 "cost_transparency_rankings": comparison.cost_transparency_rankings,
                 "consumer_insights": comparison.consumer_insights,
-                "analysis_timestamp": datetime.now().isoformat()
+                "analysis_timestamp": now_iso()
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Error generating consumer comparison: {e}")
         raise HTTPException(status_code=500, detail=f"Comparison generation failed: {str(e)}")
@@ -70,7 +82,7 @@ async def get_price_alerts(
         
         alerts = await marketplace_service.get_consumer_price_alerts(product_name, target_price)
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": f"Price alerts generated for {product_name}",
             "data": {
@@ -78,9 +90,9 @@ async def get_price_alerts(
                 "target_price": target_price,
                 "alerts": alerts,
                 "alert_count": len(alerts),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Error generating price alerts: {e}")
         raise HTTPException(status_code=500, detail=f"Price alerts generation failed: {str(e)}")
@@ -98,11 +110,11 @@ async def get_sustainability_comparison(
         
         comparison = await marketplace_service.get_sustainability_comparison(product_name)
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": f"Sustainability comparison generated for {product_name}",
             "data": comparison
-        }
+        })
     except Exception as e:
         logger.error(f"Error generating sustainability comparison: {e}")
         raise HTTPException(status_code=500, detail=f"Sustainability comparison failed: {str(e)}")
@@ -122,38 +134,48 @@ async def get_cost_transparency_report(
         
         comparison = await marketplace_service.get_consumer_product_comparison(product_name, industry, category)
         
-        # Extract cost transparency data
-        transparency_data = []
-        for price_data in comparison.top_3_prices:
-            transparency_data.append({
+        # Extract cost transparency data into parallel columns, then sort and
+        # compute percentages on the arrays instead of per dict
+        top_prices = comparison.top_3_prices
+        count = len(top_prices)
+        breakdowns = [p['cost_breakdown'] for p in top_prices]
+        prices = np.fromiter((p['price_usd'] for p in top_prices), dtype=np.float64, count=count)
+        scores = np.fromiter((b['cost_transparency_score'] for b in breakdowns), dtype=np.float64, count=count)
+        profit_margin_pct = np.round(np.fromiter((b['profit_margin'] for b in breakdowns), dtype=np.float64, count=count) / prices * 100, 1)
+        retail_markup_pct = np.round(np.fromiter((b['retail_markup'] for b in breakdowns), dtype=np.float64, count=count) / prices * 100, 1)
+        
+        transparency_rankings = []
+        for i in np.argsort(-scores, kind="stable").tolist():
+            price_data = top_prices[i]
+            transparency_rankings.append({
                 'rank': price_data['rank'],
                 'supplier_name': price_data['supplier_name'],
                 'continent': price_data['continent'],
                 'price_usd': price_data['price_usd'],
-                'cost_breakdown': price_data['cost_breakdown'],
-                'transparency_score': price_data['cost_breakdown']['cost_transparency_score'],
-                'profit_margin_percentage': round(price_data['cost_breakdown']['profit_margin'] / price_data['price_usd'] * 100, 1),
-                'retail_markup_percentage': round(price_data['cost_breakdown']['retail_markup'] / price_data['price_usd'] * 100, 1)
+                'cost_breakdown': breakdowns[i],
+                'transparency_score': float(scores[i]),
+                'profit_margin_percentage': float(profit_margin_pct[i]),
+                'retail_markup_percentage': float(retail_markup_pct[i])
             })
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": f"Cost transparency report generated for {product_name}",
             "data": {
                 "product_name": product_name,
                 "industry": industry,
                 "category": category,
-                "transparency_rankings": sorted(transparency_data, key=lambda x: x['transparency_score'], reverse=True),
-                "average_transparency": round(np.mean([d['transparency_score'] for d in transparency_data]), 3),
+                "transparency_rankings": transparency_rankings,
+                "average_transparency": round(float(scores.mean()), 3),
                 "transparency_insights": [
                     "Complete cost breakdowns reveal true pricing",
                     "Profit margins and markups clearly displayed",
                     "Consumer empowerment through transparency",
                     "Compare actual costs vs. final prices"
                 ],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Error generating cost transparency report: {e}")
         raise HTTPException(status_code=500, detail=f"Transparency report failed: {str(e)}")
@@ -173,7 +195,10 @@ async def get_consumer_insights(
         
         comparison = await marketplace_service.get_consumer_product_comparison(product_name, industry, category)
         
-        return {
+        # Memoized on the comparison; feeds both the value and the level
+        avg_transparency = comparison.transparency_avg
+        
+        return ORJSONResponse({
             "status": "success",
             "message": f"Consumer insights generated for {product_name}",
             "data": {
@@ -185,11 +210,14 @@ async def get_consumer_insights(
                 "price_analysis": {
                     "price_range": comparison.price_range,
                     "average_price": comparison.average_price,
-                    "price_variability": "High" if (comparison.price_range['max'] - comparison.price_range['min']) / comparison.average_price > 0.5 else "Low"
+                    "price_variability": _band(
+                        (comparison.price_range['max'] - comparison.price_range['min']) / comparison.average_price,
+                        _PRICE_SPREAD_BANDS, _PRICE_SPREAD_LABELS
+                    )
                 },
                 "transparency_analysis": {
-                    "average_transparency": round(np.mean([r['transparency_score'] for r in comparison.cost_transparency_rankings]), 3),
-                    "transparency_level": "Excellent" if np.mean([r['transparency_score'] for r in comparison.cost_transparency_rankings]) > 0.8 else "Good" if np.mean([r['transparency_score'] for r in comparison.cost_transparency_rankings]) > 0.6 else "Poor"
+                    "average_transparency": round(avg_transparency, 3),
+                    "transparency_level": _band(avg_transparency, _TRANSPARENCY_BANDS, _TRANSPARENCY_LABELS)
                 },
                 "consumer_recommendations": [
                     "Compare total costs, not just final prices",
@@ -198,9 +226,9 @@ async def get_consumer_insights(
                     "Check sustainability scores",
                     "Read consumer reviews and ratings"
                 ],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Error generating consumer insights: {e}")
         raise HTTPException(status_code=500, detail=f"Consumer insights failed: {str(e)}")
@@ -222,23 +250,22 @@ async def get_global_pricing_trends(
         comparison = await marketplace_service.get_consumer_product_comparison(sample_product, industry, category)
         
         # Analyze pricing by continent
-        continent_pricing = {}
+        continent_pricing = defaultdict(list)
         for price_data in comparison.top_3_prices:
-            continent = price_data['continent']
-            if continent not in continent_pricing:
-                continent_pricing[continent] = []
-            continent_pricing[continent].append(price_data['price_usd'])
+            continent_pricing[price_data['continent']].append(price_data['price_usd'])
         
         continent_analysis = {}
         for continent, prices in continent_pricing.items():
+            # One buffer per continent shared by all four reductions
+            arr = np.asarray(prices, dtype=np.float64)
             continent_analysis[continent] = {
-                'average_price': round(np.mean(prices), 2),
-                'price_range': {'min': min(prices), 'max': max(prices)},
-                'price_volatility': round(np.std(prices), 2),
-                'supplier_count': len(prices)
+                'average_price': round(float(arr.mean()), 2),
+                'price_range': {'min': float(arr.min()), 'max': float(arr.max())},
+                'price_volatility': round(float(arr.std()), 2),
+                'supplier_count': arr.size
             }
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": f"Global pricing trends generated for {industry} - {category}",
             "data": {
@@ -259,9 +286,9 @@ async def get_global_pricing_trends(
                     "Evaluate supplier reliability and delivery times",
                     "Check for regional certifications and compliance"
                 ],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Error generating global pricing trends: {e}")
         raise HTTPException(status_code=500, detail=f"Pricing trends failed: {str(e)}")
@@ -271,7 +298,7 @@ async def health_check():
     """
     Health check for Consumer Marketplace service
     """
-    return {
+    return ORJSONResponse({
         "status": "success",
         "message": "Consumer Marketplace service is healthy",
         "service": "SEEKER Consumer Marketplace",
@@ -284,4 +311,4 @@ async def health_check():
             "Sustainability rankings",
             "Price alerts and monitoring"
         ]
-    } 
\ No newline at end of file
+    }) 
\ No newline at end of file
@@ -1,14 +1,15 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional
 from app.models.conversation import ConversationSession, ConversationMessage
+from app.services.conversation_store import SessionCache, conversation_message_store
+from app.clock import utc_now
 from pydantic import BaseModel
 import uuid
-from datetime import datetime
 
 router = APIRouter()
 
-# In-memory storage for demo (replace with database)
-conversations = {}
+# In-memory storage for demo (replace with database), bounded LRU
+conversations = SessionCache(on_evict=conversation_message_store.discard_session)
 
 class AddMessageRequest(BaseModel):
     user_input: str
@@ -21,19 +22,22 @@ async def create_conversation(user_id: str):
         session_id=session_id,
         user_id=user_id
     )
-    conversations[session_id] = conversation
+    conversations.add(conversation)
+    return conversation
+
+def _get_session(session_id: str) -> ConversationSession:
+    conversation = conversations.get(session_id)
+    if conversation is None:
+        raise HTTPException(status_code=404, detail="Conversation not found")
     return conversation
 
 @router.get("/conversations/{session_id}", response_model=ConversationSession)
 async def get_conversation(session_id: str):
-    if session_id not in conversations:
-        raise HTTPException(status_code=404, detail="Conversation not found")
-    return conversations[session_id]
+    return _get_session(session_id)
 
 @router.post("/conversations/{session_id}/messages/")
 async def add_message(session_id: str, message_request: AddMessageRequest):
-    if session_id not in conversations:
-        raise HTTPException(status_code=404, detail="Conversation not found")
+    conversation = _get_session(session_id)
     
     message = ConversationMessage(
         message_id=str(uuid.uuid4()),
@@ -41,7 +45,11 @@ async def add_message(session_id: str, message_request: AddMessageRequest):
         system_response=message_request.system_response
     )
     
-    conversations[session_id].messages.append(message)
-    conversations[session_id].last_activity = datetime.now()
+    await conversation_message_store.add_message(conversation, message)
+    conversation.last_activity = utc_now()
     
-    return {"status": "Message added successfully"} 
\ No newline at end of file
+    return {"status": "Message added successfully"}
+
+@router.get("/conversations/{session_id}/messages/", response_model=List[ConversationMessage])
+async def get_messages(session_id: str, offset: int = Query(0, ge=0), limit: int = Query(50, ge=1, le=200)):
+    return await conversation_message_store.load_page(_get_session(session_id), offset, limit) 
\ No newline at end of file
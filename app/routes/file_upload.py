@@ -1,5 +1,6 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Response
 from app.models.file_attachment import FileAttachment, FileType
+from app.uploads import save_upload
 import uuid
 import os
 from datetime import datetime
@@ -9,6 +10,11 @@ router = APIRouter()
 # In-memory storage for demo
 uploaded_files = {}
 
+def _attachment_response(file_attachment: FileAttachment) -> Response:
+    # The model's compiled serializer writes JSON bytes in one pass; returning
+    # a Response skips FastAPI's response_model re-validation and encoding
+    return Response(content=file_attachment.model_dump_json(), media_type="application/json")
+
 @router.post("/upload/", response_model=FileAttachment)
 async def upload_file(file: UploadFile = File(...), user_id: str = "default_user"):
     file_id = str(uuid.uuid4())
@@ -18,10 +24,8 @@ async def upload_file(file: UploadFile = File(...), user_id: str = "default_user
     
     file_path = f"uploads/{file_id}_{file.filename}"
     
-    # Save file
-    with open(file_path, "wb") as buffer:
-        content = await file.read()
-        buffer.write(content)
+    # Stream to disk, sizing and hashing each chunk on the way through
+    file_size, file_hash = await save_upload(file, file_path)
     
     # Create file record
     file_attachment = FileAttachment(
@@ -29,16 +33,17 @@ async def upload_file(file: UploadFile = File(...), user_id: str = "default_user
         filename=file.filename or "unknown_file",
         file_type=FileType.OTHER,  # Default to OTHER, could be enhanced with MIME type mapping
         mime_type=file.content_type or "application/octet-stream",
-        file_size=len(content),
+        file_size=file_size,
+        file_hash=file_hash,
         uploaded_by=user_id,
         file_path=file_path
     )
     
     uploaded_files[file_id] = file_attachment
-    return file_attachment
+    return _attachment_response(file_attachment)
 
 @router.get("/files/{file_id}")
 async def get_file_info(file_id: str):
     if file_id not in uploaded_files:
         raise HTTPException(status_code=404, detail="File not found")
-    return uploaded_files[file_id] 
\ No newline at end of file
+    return _attachment_response(uploaded_files[file_id]) 
\ No newline at end of file
@@ -2,17 +2,35 @@
 SEEKER Files API Routes
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, File, HTTPException, UploadFile
 from typing import Dict, Any
+from app.responses import ORJSONResponse
+from app.uploads import save_upload
+import os
+import uuid
 
 router = APIRouter(prefix="/files", tags=["files"])
 
-@router.post("/upload/")
-async def upload_file():
+UPLOAD_DIR = "uploads"
+
+@router.post("/upload/", response_class=ORJSONResponse)
+async def upload_file(file: UploadFile = File(...)):
     """Upload file endpoint"""
-    return {"message": "File upload endpoint"}
+    file_id = str(uuid.uuid4())
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    dest = os.path.join(UPLOAD_DIR, f"{file_id}_{os.path.basename(file.filename or 'upload')}")
+
+    # Copy, size and hash in a single pass over the stream
+    size, sha256 = await save_upload(file, dest)
+
+    return ORJSONResponse({
+        "file_id": file_id,
+        "filename": file.filename,
+        "size": size,
+        "sha256": sha256,
+    })
 
 @router.get("/files/{file_id}")
 async def get_file_info(file_id: str):
     """Get file info endpoint"""
-    return {"file_id": file_id, "message": "File info endpoint"} 
\ No newline at end of file
+    return {"file_id": file_id, "message": "File info endpoint"}
@@ -4,27 +4,362 @@ Revolutionary shipping transparency with daily volume bidding system
 Consumer-first global logistics optimization across all 7 continents
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Response
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Dict, Iterable, List, Any, Optional, Tuple
+import asyncio
+import heapq
 import logging
+import math
+import orjson
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from motor.motor_asyncio import AsyncIOMotorClient
 import numpy as np
 
-from app.services.global_shipping_service import SEEKERGlobalShippingService, ShippingService
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; carrier totals are then reduced in plain Python
+    njit = None
+
+from app.services.global_shipping_service import SEEKERGlobalShippingService, ShippingCarrier, ShippingService
 from app.database import get_mongo_client
+from app.clock import now_iso, precise_now_iso
+from app.responses import ORJSONResponse, dumps
+from app.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/global-shipping", tags=["Global Shipping Marketplace"])
 
-def get_global_shipping_service():
+# Static responses, encoded once at import; only the timestamp is spliced in
+# per request, so each prefix stops short of the closing braces
+_CARRIERS = [
+    {
+        "carrier": "FEDEX",
+        "name": "Federal Express",
+        "regions": ["north_america", "europe", "asia", "australia_oceania"],
+        "services": ["express", "standard", "economy", "ground", "air"],
+        "reliability_score": 0.95,
+        "sustainability_score": 0.78
+    },
+    {
+        "carrier": "UPS",
+        "name": "United Parcel Service",
+        "regions": ["north_america", "europe", "asia", "south_america"],
+        "services": ["express", "standard", "economy", "ground", "air"],
+        "reliability_score": 0.93,
+        "sustainability_score": 0.82
+    },
+    {
+        "carrier": "DHL",
+        "name": "DHL Express",
+        "regions": ["north_america", "europe", "asia", "africa", "south_america", "australia_oceania"],
+        "services": ["express", "standard", "economy", "ground", "air", "sea"],
+        "reliability_score": 0.91,
+        "sustainability_score": 0.85
+    },
+    {
+        "carrier": "USPS",
+        "name": "United States Postal Service",
+        "regions": ["north_america"],
+        "services": ["express", "standard", "economy", "ground"],
+        "reliability_score": 0.88,
+        "sustainability_score": 0.75
+    },
+    {
+        "carrier": "ROYAL_MAIL",
+        "name": "Royal Mail",
+        "regions": ["europe"],
+        "services": ["express", "standard", "economy", "ground"],
+        "reliability_score": 0.89,
+        "sustainability_score": 0.80
+    },
+    {
+        "carrier": "DEUTSCHE_POST",
+        "name": "Deutsche Post",
+        "regions": ["europe"],
+        "services": ["express", "standard", "economy", "ground"],
+        "reliability_score": 0.90,
+        "sustainability_score": 0.83
+    },
+    {
+        "carrier": "JAPAN_POST",
+        "name": "Japan Post",
+        "regions": ["asia"],
+        "services": ["express", "standard", "economy", "ground"],
+        "reliability_score": 0.92,
+        "sustainability_score": 0.79
+    },
+    {
+        "carrier": "CHINA_POST",
+        "name": "China Post",
+        "regions": ["asia"],
+        "services": ["express", "standard", "economy", "ground"],
+        "reliability_score": 0.87,
+        "sustainability_score": 0.72
+    },
+    {
+        "carrier": "AUSTRALIA_POST",
+        "name": "Australia Post",
+        "regions": ["australia_oceania"],
+        "services": ["express", "standard", "economy", "ground"],
+        "reliability_score": 0.89,
+        "sustainability_score": 0.81
+    },
+    {
+        "carrier": "CANADA_POST",
+        "name": "Canada Post",
+        "regions": ["north_america"],
+        "services": ["express", "standard", "economy", "ground"],
+        "reliability_score": 0.91,
+        "sustainability_score": 0.84
+    },
+    {
+        "carrier": "REGIONAL_CARRIERS",
+        "name": "Regional Carriers",
+        "regions": ["africa", "south_america", "antarctica"],
+        "services": ["standard", "economy", "ground"],
+        "reliability_score": 0.85,
+        "sustainability_score": 0.70
+    }
+]
+
+_CARRIERS_RESPONSE = {
+    "status": "success",
+    "message": "Available carriers retrieved",
+    "data": {
+        "carriers": _CARRIERS,
+        "total_carriers": len(_CARRIERS),
+        "continents_covered": 7,
+        "service_types": ["express", "standard", "economy", "ground", "air", "sea"]
+    }
+}
+_CARRIERS_BODY_PREFIX = orjson.dumps(_CARRIERS_RESPONSE)[:-2]
+
+_HEALTH_RESPONSE = {
+    "status": "healthy",
+    "service": "Global Shipping Marketplace",
+    "features": [
+        "Daily Volume Bidding System",
+        "Consumer Shipping Transparency",
+        "Carrier Competition Platform",
+        "Sustainability Comparison",
+        "Global Logistics Optimization"
+    ],
+    "version": "1.0.0"
+}
+_HEALTH_BODY_PREFIX = orjson.dumps(_HEALTH_RESPONSE)[:-1]
+
+# Static tails of the streamed comparison responses, from the end of the
+# streamed row list up to the timestamp value
+_COMPARISON_INSIGHTS = [
+    "Volume bidding creates 15-40% savings for consumers",
+    "DHL leads in sustainability and reliability scores",
+    "Regional carriers offer best value for local routes",
+    "Express services have highest reliability scores",
+    "Ground shipping provides best sustainability options"
+]
+_COMPARISON_TAIL = b'],"comparison_insights":' + orjson.dumps(_COMPARISON_INSIGHTS) + b',"timestamp":'
+
+_SUSTAINABILITY_INSIGHTS = [
+    "DHL leads with 85% sustainability score",
+    "Ground shipping has lowest carbon footprint",
+    "Sea freight is most environmentally friendly",
+    "Express services have highest carbon impact",
+    "Renewable energy usage ranges from 15-35%"
+]
+_ENVIRONMENTAL_IMPACT_ANALYSIS = {
+    "carbon_footprint_ranges": {
+        "express": "8-12 kg CO2",
+        "standard": "5-8 kg CO2", 
+        "economy": "3-6 kg CO2",
+        "ground": "2-4 kg CO2",
+        "air": "8-12 kg CO2",
+        "sea": "1-3 kg CO2"
+    },
+    "sustainability_recommendations": [
+        "Choose ground shipping for lowest environmental impact",
+        "Consider sea freight for non-urgent shipments",
+        "Look for carriers with high renewable energy usage",
+        "Select eco-friendly packaging options",
+        "Support carriers with carbon neutral programs"
+    ]
+}
+_SUSTAINABILITY_TAIL = (
+    b'],"sustainability_insights":' + orjson.dumps(_SUSTAINABILITY_INSIGHTS)
+    + b',"environmental_impact_analysis":' + orjson.dumps(_ENVIRONMENTAL_IMPACT_ANALYSIS)
+    + b',"timestamp":'
+)
+
+@lru_cache(maxsize=1)
+def _get_service(mongo_client: AsyncIOMotorClient) -> SEEKERGlobalShippingService:
+    # Construction does no I/O, so a failure here is a bug rather than a
+    # missing database and is left to surface
+    return SEEKERGlobalShippingService(mongo_client)
+
+async def get_global_shipping_service(mongo_client: AsyncIOMotorClient = Depends(get_mongo_client)):
     """Dependency injection for Global Shipping Service"""
-    try:
-        mongo_client = get_mongo_client()
-        return SEEKERGlobalShippingService(mongo_client)
-    except Exception as e:
-        logger.warning(f"MongoDB client not available, using demo mode: {e}")
-        return SEEKERGlobalShippingService(None)
+    return _get_service(mongo_client)
+
+# Service type lookup by value, and the service types each comparison covers
+_SERVICE_ENUM: Dict[str, ShippingService] = {service.value: service for service in ShippingService}
+_COMPARISON_SERVICES = tuple(_SERVICE_ENUM[s] for s in ('express', 'standard', 'economy', 'ground', 'air'))
+_TRANSPARENCY_SERVICES = tuple(_SERVICE_ENUM[s] for s in ('express', 'standard', 'economy'))
+_SUSTAINABILITY_SERVICES = tuple(_SERVICE_ENUM[s] for s in ('express', 'standard', 'economy', 'ground', 'air', 'sea'))
+
+# Quotes for the same route, parcel and service are reused for this long; the
+# comparison endpoints overlap on most service types
+QUOTE_CACHE_TTL = 60.0
+QUOTE_CACHE_SIZE = 4096
+_quote_cache: TTLCache[Tuple[str, str, float, float, ShippingService], Any] = TTLCache(QUOTE_CACHE_TTL, QUOTE_CACHE_SIZE)
+
+async def _cached_quote(
+    shipping_service: SEEKERGlobalShippingService,
+    origin: str,
+    destination: str,
+    weight_kg: float,
+    volume_cm3: float,
+    service_enum: ShippingService
+) -> Any:
+    """
+    Return a recent quote, requesting it once per key while it is missing or stale
+    
+    The key holds the exact parcel weight and volume, since the quote echoes
+    them back and prices from them.
+    """
+    return await _quote_cache.get_or_compute(
+        (origin, destination, weight_kg, volume_cm3, service_enum),
+        lambda: shipping_service.get_consumer_shipping_quote(
+            origin, destination, weight_kg, volume_cm3, service_enum
+        )
+    )
+
+async def _stream_rows(head: bytes, rows: Iterable[Any], tail: bytes) -> AsyncIterator[bytes]:
+    """Yield a JSON document around one list field, one encoded row per chunk"""
+    yield head
+    separator = b''
+    for row in rows:
+        yield separator + dumps(row)
+        separator = b','
+    yield tail
+
+def _new_carrier_totals() -> Dict[str, float]:
+    return {
+        'services_offered': 0,
+        'average_rate_usd': 0,
+        'average_delivery_days': 0,
+        'average_reliability': 0,
+        'average_sustainability': 0,
+        'best_value_score': 0,
+        'total_volume_discount': 0
+    }
+
+# Carrier comparison rows projected for the reduction kernel: carrier index,
+# then the five averaged fields, then the consumer value score
+_CARRIER_NAMES = tuple(carrier.value.upper() for carrier in ShippingCarrier)
+_CARRIER_INDEX = {name: i for i, name in enumerate(_CARRIER_NAMES)}
+_AVERAGED_FIELDS = ('final_rate_usd', 'delivery_days', 'reliability_score', 'sustainability_score', 'volume_discount_percentage')
+
+def _reduce_carrier_rows(rows: np.ndarray, n_carriers: int):
+    """Per-carrier row counts, sums of the averaged fields and best value score"""
+    sums = np.zeros((n_carriers, 5))
+    counts = np.zeros(n_carriers, np.int64)
+    best = np.zeros(n_carriers)
+    for i in range(rows.shape[0]):
+        c = int(rows[i, 0])
+        counts[c] += 1
+        sums[c] += rows[i, 1:6]
+        if rows[i, 6] > best[c]:
+            best[c] = rows[i, 6]
+    return sums, counts, best
+
+if njit is not None:
+    _reduce_carrier_rows = njit(cache=True)(_reduce_carrier_rows)
+    # Compile (or load from cache) at import rather than on the first request
+    _reduce_carrier_rows(np.zeros((1, 7)), len(_CARRIER_NAMES))
+
+def _carrier_summary_entry(carrier_name: str, services: int, totals, best_value_score: float) -> Dict[str, Any]:
+    rate, delivery_days, reliability, sustainability, volume_discount = totals
+    inv = 1.0 / services
+    return {
+        'carrier_name': carrier_name,
+        'services_offered': services,
+        'average_rate_usd': round(rate * inv, 2),
+        'average_delivery_days': round(delivery_days * inv, 1),
+        'average_reliability': round(reliability * inv, 3),
+        'average_sustainability': round(sustainability * inv, 3),
+        'best_value_score': best_value_score,
+        'total_volume_discount': round(volume_discount * inv, 1)
+    }
+
+def _summarize_carriers(all_carriers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Average each carrier's quoted rows, compiled with numba when it is installed"""
+    if njit is not None:
+        rows = np.empty((len(all_carriers), 7))
+        for i, carrier in enumerate(all_carriers):
+            rows[i, 0] = _CARRIER_INDEX[carrier['carrier_name']]
+            rows[i, 1:6] = [carrier[field] for field in _AVERAGED_FIELDS]
+            rows[i, 6] = carrier['consumer_value_score']
+        sums, counts, best = _reduce_carrier_rows(rows, len(_CARRIER_NAMES))
+        return [
+            _carrier_summary_entry(_CARRIER_NAMES[c], int(counts[c]), sums[c].tolist(), float(best[c]))
+            for c in np.flatnonzero(counts)
+        ]
+    
+    carrier_summary = defaultdict(_new_carrier_totals)
+    for carrier in all_carriers:
+        summary = carrier_summary[carrier['carrier_name']]
+        summary['services_offered'] += 1
+        summary['average_rate_usd'] += carrier['final_rate_usd']
+        summary['average_delivery_days'] += carrier['delivery_days']
+        summary['average_reliability'] += carrier['reliability_score']
+        summary['average_sustainability'] += carrier['sustainability_score']
+        summary['total_volume_discount'] += carrier['volume_discount_percentage']
+        if carrier['consumer_value_score'] > summary['best_value_score']:
+            summary['best_value_score'] = carrier['consumer_value_score']
+    return [
+        _carrier_summary_entry(
+            carrier_name,
+            summary['services_offered'],
+            (
+                summary['average_rate_usd'],
+                summary['average_delivery_days'],
+                summary['average_reliability'],
+                summary['average_sustainability'],
+                summary['total_volume_discount']
+            ),
+            summary['best_value_score']
+        )
+        for carrier_name, summary in carrier_summary.items()
+    ]
+
+async def _gather_quotes(
+    shipping_service: SEEKERGlobalShippingService,
+    origin: str,
+    destination: str,
+    weight_kg: float,
+    volume_cm3: float,
+    service_enums: Tuple[ShippingService, ...]
+) -> List[Tuple[str, Any]]:
+    """Request a quote per service type concurrently; failed service types are logged and skipped"""
+    quotes = await asyncio.gather(
+        *(
+            _cached_quote(shipping_service, origin, destination, weight_kg, volume_cm3, service_enum)
+            for service_enum in service_enums
+        ),
+        return_exceptions=True
+    )
+    
+    results = []
+    for service_enum, quote in zip(service_enums, quotes):
+        if isinstance(quote, Exception):
+            logger.warning(f"Error getting quote for {service_enum.value}: {quote}")
+            continue
+        results.append((service_enum.value, quote))
+    return results
 
 @router.get("/shipping-quote")
 async def get_consumer_shipping_quote(
@@ -38,20 +373,19 @@ async def get_consumer_shipping_quote(
     """
     Get revolutionary consumer shipping quote with volume bidding advantages
     """
+    # Convert service type string to enum
+    service_enum = _SERVICE_ENUM.get(service_type.lower())
+    if service_enum is None:
+        raise HTTPException(status_code=400, detail=f"Invalid service type: {service_type}")
+    
     try:
         logger.info(f"🚢 Getting shipping quote: {origin} → {destination}")
         
-        # Convert service type string to enum
-        try:
-            service_enum = ShippingService(service_type.lower())
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid service type: {service_type}")
-        
-        quote = await shipping_service.get_consumer_shipping_quote(
-            origin, destination, weight_kg, volume_cm3, service_enum
+        quote = await _cached_quote(
+            shipping_service, origin, destination, weight_kg, volume_cm3, service_enum
         )
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": f"Shipping quote generated for {origin} → {destination}",
             "data": {
@@ -65,9 +399,9 @@ async def get_consumer_shipping_quote(
                 "transparency_breakdown": quote.transparency_breakdown,
                 "delivery_options": quote.delivery_options,
                 "sustainability_ranking": quote.sustainability_ranking,
-                "quote_timestamp": datetime.now().isoformat()
+                "quote_timestamp": precise_now_iso()
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Error generating shipping quote: {e}")
         raise HTTPException(status_code=500, detail=f"Shipping quote generation failed: {str(e)}")
@@ -102,15 +436,15 @@ async def get_daily_volume_bidding(
                 'sustainability_score': round(bid.sustainability_score, 3),
                 'daily_volume_requirement': bid.daily_volume_requirement,
                 'bid_status': bid.status.value,
-                'bid_expiry': bid.bid_expiry.isoformat()
+                'bid_expiry': bid.bid_expiry
             }
             formatted_bids.append(formatted_bid)
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": f"Daily volume bidding results for {origin_continent} → {destination_continent}",
             "data": {
-                "date": aggregation.date.isoformat(),
+                "date": aggregation.date,
                 "origin_continent": aggregation.origin_continent,
                 "destination_continent": aggregation.destination_continent,
                 "total_weight_kg": round(aggregation.total_weight_kg, 2),
@@ -127,9 +461,9 @@ async def get_daily_volume_bidding(
                     "Consumer savings passed through from volume advantages",
                     "Transparent bidding process shows true market rates"
                 ],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Error getting daily volume bidding: {e}")
         raise HTTPException(status_code=500, detail=f"Volume bidding failed: {str(e)}")
@@ -150,76 +484,36 @@ async def get_carrier_comparison(
         
         # Get quotes for all service types
         all_carriers = []
-        service_types = ['express', 'standard', 'economy', 'ground', 'air']
         
-        for service_type in service_types:
-            try:
-                service_enum = ShippingService(service_type)
-                quote = await shipping_service.get_consumer_shipping_quote(
-                    origin, destination, weight_kg, volume_cm3, service_enum
-                )
-                
-                for carrier in quote.top_3_carriers:
-                    carrier_info = {
-                        'service_type': service_type,
-                        'carrier_name': carrier['carrier_name'],
-                        'rank': carrier['rank'],
-                        'final_rate_usd': carrier['final_rate_usd'],
-                        'delivery_days': carrier['delivery_days'],
-                        'reliability_score': carrier['reliability_score'],
-                        'sustainability_score': carrier['sustainability_score'],
-                        'consumer_value_score': carrier['consumer_value_score'],
-                        'volume_discount_percentage': carrier['volume_discount_percentage']
-                    }
-                    all_carriers.append(carrier_info)
-            except Exception as e:
-                logger.warning(f"Error getting quote for {service_type}: {e}")
-                continue
+        quotes = await _gather_quotes(shipping_service, origin, destination, weight_kg, volume_cm3, _COMPARISON_SERVICES)
         
-        # Sort by consumer value score
-        all_carriers.sort(key=lambda x: x['consumer_value_score'], reverse=True)
+        for service_type, quote in quotes:
+            for carrier in quote.top_3_carriers:
+                carrier_info = {
+                    'service_type': service_type,
+                    'carrier_name': carrier['carrier_name'],
+                    'rank': carrier['rank'],
+                    'final_rate_usd': carrier['final_rate_usd'],
+                    'delivery_days': carrier['delivery_days'],
+                    'reliability_score': carrier['reliability_score'],
+                    'sustainability_score': carrier['sustainability_score'],
+                    'consumer_value_score': carrier['consumer_value_score'],
+                    'volume_discount_percentage': carrier['volume_discount_percentage']
+                }
+                all_carriers.append(carrier_info)
         
         # Group by carrier for summary
-        carrier_summary = {}
-        for carrier in all_carriers:
-            carrier_name = carrier['carrier_name']
-            if carrier_name not in carrier_summary:
-                carrier_summary[carrier_name] = {
-                    'carrier_name': carrier_name,
-                    'services_offered': 0,
-                    'average_rate_usd': 0,
-                    'average_delivery_days': 0,
-                    'average_reliability': 0,
-                    'average_sustainability': 0,
-                    'best_value_score': 0,
-                    'total_volume_discount': 0
-                }
-            
-            summary = carrier_summary[carrier_name]
-            summary['services_offered'] += 1
-            summary['average_rate_usd'] += carrier['final_rate_usd']
-            summary['average_delivery_days'] += carrier['delivery_days']
-            summary['average_reliability'] += carrier['reliability_score']
-            summary['average_sustainability'] += carrier['sustainability_score']
-            summary['total_volume_discount'] += carrier['volume_discount_percentage']
-            
-            if carrier['consumer_value_score'] > summary['best_value_score']:
-                summary['best_value_score'] = carrier['consumer_value_score']
+        carrier_summary_list = _summarize_carriers(all_carriers)
         
-        # Calculate averages
-        for carrier_name, summary in carrier_summary.items():
-            services = summary['services_offered']
-            summary['average_rate_usd'] = round(summary['average_rate_usd'] / services, 2)
-            summary['average_delivery_days'] = round(summary['average_delivery_days'] / services, 1)
-            summary['average_reliability'] = round(summary['average_reliability'] / services, 3)
-            summary['average_sustainability'] = round(summary['average_sustainability'] / services, 3)
-            summary['total_volume_discount'] = round(summary['total_volume_discount'] / services, 1)
+        # Top 20 by consumer value score; the rest of the rows are never sent
+        detailed_comparison = heapq.nlargest(20, all_carriers, key=itemgetter('consumer_value_score'))
         
         # Sort summary by best value score
-        carrier_summary_list = list(carrier_summary.values())
-        carrier_summary_list.sort(key=lambda x: x['best_value_score'], reverse=True)
+        carrier_summary_list.sort(key=itemgetter('best_value_score'), reverse=True)
         
-        return {
+        # Encode the envelope up to the detailed comparison, which is then
+        # sent a row at a time
+        head = dumps({
             "status": "success",
             "message": f"Carrier comparison completed for {origin} → {destination}",
             "data": {
@@ -227,20 +521,17 @@ async def get_carrier_comparison(
                 "destination": destination,
                 "weight_kg": weight_kg,
                 "volume_cm3": volume_cm3,
-                "total_carriers_compared": len(carrier_summary),
+                "total_carriers_compared": len(carrier_summary_list),
                 "total_quotes_generated": len(all_carriers),
-                "carrier_summary": carrier_summary_list,
-                "detailed_comparison": all_carriers[:20],  # Top 20 results
-                "comparison_insights": [
-                    "Volume bidding creates 15-40% savings for consumers",
-                    "DHL leads in sustainability and reliability scores",
-                    "Regional carriers offer best value for local routes",
-                    "Express services have highest reliability scores",
-                    "Ground shipping provides best sustainability options"
-                ],
-                "timestamp": datetime.now().isoformat()
+                "carrier_summary": carrier_summary_list
             }
-        }
+        })[:-2] + b',"detailed_comparison":['
+        tail = _COMPARISON_TAIL + dumps(now_iso()) + b'}}'
+        
+        return StreamingResponse(
+            _stream_rows(head, detailed_comparison, tail),
+            media_type="application/json"
+        )
     except Exception as e:
         logger.error(f"Error comparing carriers: {e}")
         raise HTTPException(status_code=500, detail=f"Carrier comparison failed: {str(e)}")
@@ -261,40 +552,36 @@ async def get_shipping_transparency_report(
         
         # Get quotes for different service types
         transparency_data = []
-        service_types = ['express', 'standard', 'economy']
         
-        for service_type in service_types:
-            try:
-                service_enum = ShippingService(service_type)
-                quote = await shipping_service.get_consumer_shipping_quote(
-                    origin, destination, weight_kg, volume_cm3, service_enum
-                )
-                
-                for carrier in quote.top_3_carriers:
-                    transparency_info = {
-                        'service_type': service_type,
-                        'carrier_name': carrier['carrier_name'],
-                        'rank': carrier['rank'],
-                        'final_rate_usd': carrier['final_rate_usd'],
-                        'transparency_breakdown': carrier['transparency_breakdown'],
-                        'volume_discount_percentage': carrier['volume_discount_percentage'],
-                        'reliability_score': carrier['reliability_score'],
-                        'sustainability_score': carrier['sustainability_score']
-                    }
-                    transparency_data.append(transparency_info)
-            except Exception as e:
-                logger.warning(f"Error getting transparency data for {service_type}: {e}")
-                continue
+        quotes = await _gather_quotes(shipping_service, origin, destination, weight_kg, volume_cm3, _TRANSPARENCY_SERVICES)
         
-        # Calculate transparency metrics
-        total_savings = sum(quote.volume_advantage_savings for _ in range(len(transparency_data)))
-        avg_transparency_score = np.mean([
-            carrier['reliability_score'] * 0.6 + carrier['sustainability_score'] * 0.4 
-            for data in transparency_data 
-            for carrier in [data]
-        ])
+        for service_type, quote in quotes:
+            for carrier in quote.top_3_carriers:
+                transparency_info = {
+                    'service_type': service_type,
+                    'carrier_name': carrier['carrier_name'],
+                    'rank': carrier['rank'],
+                    'final_rate_usd': carrier['final_rate_usd'],
+                    'transparency_breakdown': carrier['transparency_breakdown'],
+                    'volume_discount_percentage': carrier['volume_discount_percentage'],
+                    'reliability_score': carrier['reliability_score'],
+                    'sustainability_score': carrier['sustainability_score']
+                }
+                transparency_data.append(transparency_info)
+        
+        # Calculate transparency metrics: savings once per quote, score as one
+        # vectorized weighted mean over all carrier rows. A quote without
+        # carriers (demo mode) has NaN savings and contributes nothing
+        total_savings = sum(
+            quote.volume_advantage_savings for _, quote in quotes
+            if math.isfinite(quote.volume_advantage_savings)
+        )
+        count = len(transparency_data)
+        reliability = np.fromiter((data['reliability_score'] for data in transparency_data), dtype=np.float64, count=count)
+        sustainability = np.fromiter((data['sustainability_score'] for data in transparency_data), dtype=np.float64, count=count)
+        avg_transparency_score = float((reliability * 0.6 + sustainability * 0.4).mean()) if count else 0.0
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": f"Shipping transparency report generated for {origin} → {destination}",
             "data": {
@@ -304,7 +591,7 @@ async def get_shipping_transparency_report(
                 "volume_cm3": volume_cm3,
                 "total_volume_savings": round(total_savings, 2),
                 "average_transparency_score": round(avg_transparency_score, 3),
-                "transparency_rankings": sorted(transparency_data, key=lambda x: x['final_rate_usd']),
+                "transparency_rankings": sorted(transparency_data, key=itemgetter('final_rate_usd')),
                 "cost_breakdown_analysis": {
                     "base_shipping_costs": "Direct transportation and handling costs",
                     "volume_discounts": "Savings from daily volume aggregation",
@@ -327,9 +614,9 @@ async def get_shipping_transparency_report(
                     "Make informed sustainability choices",
                     "Track real-time pricing transparency"
                 ],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Error generating transparency report: {e}")
         raise HTTPException(status_code=500, detail=f"Transparency report failed: {str(e)}")
@@ -350,75 +637,65 @@ async def get_sustainability_comparison(
         
         # Get sustainability data for all service types
         sustainability_data = []
-        service_types = ['express', 'standard', 'economy', 'ground', 'air', 'sea']
         
-        for service_type in service_types:
-            try:
-                service_enum = ShippingService(service_type)
-                quote = await shipping_service.get_consumer_shipping_quote(
-                    origin, destination, weight_kg, volume_cm3, service_enum
-                )
+        quotes = await _gather_quotes(shipping_service, origin, destination, weight_kg, volume_cm3, _SUSTAINABILITY_SERVICES)
+        
+        # One pass collects the rows, the overall totals and the per-carrier
+        # totals; carrier slots are [services, sustainability, carbon footprint,
+        # renewable energy, eco packaging, initiatives]
+        total_sustainability = total_carbon_footprint = total_renewable_energy = 0.0
+        carrier_totals = defaultdict(lambda: [0, 0.0, 0.0, 0.0, 0.0, {}])
+        for service_type, quote in quotes:
+            for carrier in quote.sustainability_ranking:
+                sustainability_info = {
+                    'service_type': service_type,
+                    'carrier_name': carrier['carrier'],
+                    'sustainability_score': carrier['sustainability_score'],
+                    'carbon_footprint_kg': carrier['carbon_footprint_kg'],
+                    'renewable_energy_usage': carrier['renewable_energy_usage'],
+                    'eco_friendly_packaging': carrier['eco_friendly_packaging'],
+                    'sustainability_initiatives': carrier['sustainability_initiatives']
+                }
+                sustainability_data.append(sustainability_info)
                 
-                for carrier in quote.sustainability_ranking:
-                    sustainability_info = {
-                        'service_type': service_type,
-                        'carrier_name': carrier['carrier'],
-                        'sustainability_score': carrier['sustainability_score'],
-                        'carbon_footprint_kg': carrier['carbon_footprint_kg'],
-                        'renewable_energy_usage': carrier['renewable_energy_usage'],
-                        'eco_friendly_packaging': carrier['eco_friendly_packaging'],
-                        'sustainability_initiatives': carrier['sustainability_initiatives']
-                    }
-                    sustainability_data.append(sustainability_info)
-            except Exception as e:
-                logger.warning(f"Error getting sustainability data for {service_type}: {e}")
-                continue
+                total_sustainability += carrier['sustainability_score']
+                total_carbon_footprint += carrier['carbon_footprint_kg']
+                total_renewable_energy += carrier['renewable_energy_usage']
+                
+                totals = carrier_totals[carrier['carrier']]
+                totals[0] += 1
+                totals[1] += carrier['sustainability_score']
+                totals[2] += carrier['carbon_footprint_kg']
+                totals[3] += carrier['renewable_energy_usage']
+                totals[4] += carrier['eco_friendly_packaging']
+                # Unique initiatives, in first-seen order
+                totals[5].update(dict.fromkeys(carrier['sustainability_initiatives']))
         
         # Calculate sustainability metrics
-        avg_sustainability = np.mean([data['sustainability_score'] for data in sustainability_data])
-        avg_carbon_footprint = np.mean([data['carbon_footprint_kg'] for data in sustainability_data])
-        avg_renewable_energy = np.mean([data['renewable_energy_usage'] for data in sustainability_data])
-        
-        # Group by carrier for summary
-        carrier_sustainability = {}
-        for data in sustainability_data:
-            carrier_name = data['carrier_name']
-            if carrier_name not in carrier_sustainability:
-                carrier_sustainability[carrier_name] = {
-                    'carrier_name': carrier_name,
-                    'services_analyzed': 0,
-                    'average_sustainability_score': 0,
-                    'average_carbon_footprint': 0,
-                    'average_renewable_energy': 0,
-                    'eco_packaging_score': 0,
-                    'sustainability_initiatives': []
-                }
-            
-            summary = carrier_sustainability[carrier_name]
-            summary['services_analyzed'] += 1
-            summary['average_sustainability_score'] += data['sustainability_score']
-            summary['average_carbon_footprint'] += data['carbon_footprint_kg']
-            summary['average_renewable_energy'] += data['renewable_energy_usage']
-            summary['eco_packaging_score'] += data['eco_friendly_packaging']
-            
-            # Collect unique initiatives
-            for initiative in data['sustainability_initiatives']:
-                if initiative not in summary['sustainability_initiatives']:
-                    summary['sustainability_initiatives'].append(initiative)
+        rows = len(sustainability_data)
+        avg_sustainability = total_sustainability / rows if rows else 0.0
+        avg_carbon_footprint = total_carbon_footprint / rows if rows else 0.0
+        avg_renewable_energy = total_renewable_energy / rows if rows else 0.0
         
-        # Calculate averages
-        for carrier_name, summary in carrier_sustainability.items():
-            services = summary['services_analyzed']
-            summary['average_sustainability_score'] = round(summary['average_sustainability_score'] / services, 3)
-            summary['average_carbon_footprint'] = round(summary['average_carbon_footprint'] / services, 2)
-            summary['average_renewable_energy'] = round(summary['average_renewable_energy'] / services, 3)
-            summary['eco_packaging_score'] = round(summary['eco_packaging_score'] / services, 3)
+        # Calculate per-carrier averages
+        carrier_sustainability_list = []
+        for carrier_name, (services, sustainability, carbon_footprint, renewable_energy, eco_packaging, initiatives) in carrier_totals.items():
+            carrier_sustainability_list.append({
+                'carrier_name': carrier_name,
+                'services_analyzed': services,
+                'average_sustainability_score': round(sustainability / services, 3),
+                'average_carbon_footprint': round(carbon_footprint / services, 2),
+                'average_renewable_energy': round(renewable_energy / services, 3),
+                'eco_packaging_score': round(eco_packaging / services, 3),
+                'sustainability_initiatives': list(initiatives)
+            })
         
         # Sort by sustainability score
-        carrier_sustainability_list = list(carrier_sustainability.values())
-        carrier_sustainability_list.sort(key=lambda x: x['average_sustainability_score'], reverse=True)
+        carrier_sustainability_list.sort(key=itemgetter('average_sustainability_score'), reverse=True)
         
-        return {
+        # Encode the envelope up to the detailed data, which is then sent a
+        # row at a time
+        head = dumps({
             "status": "success",
             "message": f"Sustainability comparison completed for {origin} → {destination}",
             "data": {
@@ -430,37 +707,17 @@ async def get_sustainability_comparison(
                     "average_sustainability_score": round(avg_sustainability, 3),
                     "average_carbon_footprint_kg": round(avg_carbon_footprint, 2),
                     "average_renewable_energy_usage": round(avg_renewable_energy * 100, 1),
-                    "total_carriers_analyzed": len(carrier_sustainability)
+                    "total_carriers_analyzed": len(carrier_totals)
                 },
-                "carrier_sustainability_ranking": carrier_sustainability_list,
-                "detailed_sustainability_data": sustainability_data,
-                "sustainability_insights": [
-                    "DHL leads with 85% sustainability score",
-                    "Ground shipping has lowest carbon footprint",
-                    "Sea freight is most environmentally friendly",
-                    "Express services have highest carbon impact",
-                    "Renewable energy usage ranges from 15-35%"
-                ],
-                "environmental_impact_analysis": {
-                    "carbon_footprint_ranges": {
-                        "express": "8-12 kg CO2",
-                        "standard": "5-8 kg CO2", 
-                        "economy": "3-6 kg CO2",
-                        "ground": "2-4 kg CO2",
-                        "air": "8-12 kg CO2",
-                        "sea": "1-3 kg CO2"
-                    },
-                    "sustainability_recommendations": [
-                        "Choose ground shipping for lowest environmental impact",
-                        "Consider sea freight for non-urgent shipments",
-                        "Look for carriers with high renewable energy usage",
-                        "Select eco-friendly packaging options",
-                        "Support carriers with carbon neutral programs"
-                    ]
-                },
-                "timestamp": datetime.now().isoformat()
+                "carrier_sustainability_ranking": carrier_sustainability_list
             }
-        }
+        })[:-2] + b',"detailed_sustainability_data":['
+        tail = _SUSTAINABILITY_TAIL + dumps(now_iso()) + b'}}'
+        
+        return StreamingResponse(
+            _stream_rows(head, sustainability_data, tail),
+            media_type="application/json"
+        )
     except Exception as e:
         logger.error(f"Error generating sustainability comparison: {e}")
         raise HTTPException(status_code=500, detail=f"Sustainability comparison failed: {str(e)}")
@@ -477,11 +734,11 @@ async def get_global_shipping_insights(
         
         insights = await shipping_service.get_global_shipping_insights()
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": "Global shipping insights generated",
             "data": insights
-        }
+        })
     except Exception as e:
         logger.error(f"Error generating global shipping insights: {e}")
         raise HTTPException(status_code=500, detail=f"Insights generation failed: {str(e)}")
@@ -491,124 +748,17 @@ async def get_available_carriers():
     """
     Get list of all available shipping carriers
     """
-    carriers = [
-        {
-            "carrier": "FEDEX",
-            "name": "Federal Express",
-            "regions": ["north_america", "europe", "asia", "australia_oceania"],
-            "services": ["express", "standard", "economy", "ground", "air"],
-            "reliability_score": 0.95,
-            "sustainability_score": 0.78
-        },
-        {
-            "carrier": "UPS",
-            "name": "United Parcel Service",
-            "regions": ["north_america", "europe", "asia", "south_america"],
-            "services": ["express", "standard", "economy", "ground", "air"],
-            "reliability_score": 0.93,
-            "sustainability_score": 0.82
-        },
-        {
-            "carrier": "DHL",
-            "name": "DHL Express",
-            "regions": ["north_america", "europe", "asia", "africa", "south_america", "australia_oceania"],
-            "services": ["express", "standard", "economy", "ground", "air", "sea"],
-            "reliability_score": 0.91,
-            "sustainability_score": 0.85
-        },
-        {
-            "carrier": "USPS",
-            "name": "United States Postal Service",
-            "regions": ["north_america"],
-            "services": ["express", "standard", "economy", "ground"],
-            "reliability_score": 0.88,
-            "sustainability_score": 0.75
-        },
-        {
-            "carrier": "ROYAL_MAIL",
-            "name": "Royal Mail",
-            "regions": ["europe"],
-            "services": ["express", "standard", "economy", "ground"],
-            "reliability_score": 0.89,
-            "sustainability_score": 0.80
-        },
-        {
-            "carrier": "DEUTSCHE_POST",
-            "name": "Deutsche Post",
-            "regions": ["europe"],
-            "services": ["express", "standard", "economy", "ground"],
-            "reliability_score": 0.90,
-            "sustainability_score": 0.83
-        },
-        {
-            "carrier": "JAPAN_POST",
-            "name": "Japan Post",
-            "regions": ["asia"],
-            "services": ["express", "standard", "economy", "ground"],
-            "reliability_score": 0.92,
-            "sustainability_score": 0.79
-        },
-        {
-            "carrier": "CHINA_POST",
-            "name": "China Post",
-            "regions": ["asia"],
-            "services": ["express", "standard", "economy", "ground"],
-            "reliability_score": 0.87,
-            "sustainability_score": 0.72
-        },
-        {
-            "carrier": "AUSTRALIA_POST",
-            "name": "Australia Post",
-            "regions": ["australia_oceania"],
-            "services": ["express", "standard", "economy", "ground"],
-            "reliability_score": 0.89,
-            "sustainability_score": 0.81
-        },
-        {
-            "carrier": "CANADA_POST",
-            "name": "Canada Post",
-            "regions": ["north_america"],
-            "services": ["express", "standard", "economy", "ground"],
-            "reliability_score": 0.91,
-            "sustainability_score": 0.84
-        },
-        {
-            "carrier": "REGIONAL_CARRIERS",
-            "name": "Regional Carriers",
-            "regions": ["africa", "south_america", "antarctica"],
-            "services": ["standard", "economy", "ground"],
-            "reliability_score": 0.85,
-            "sustainability_score": 0.70
-        }
-    ]
-    
-    return {
-        "status": "success",
-        "message": "Available carriers retrieved",
-        "data": {
-            "carriers": carriers,
-            "total_carriers": len(carriers),
-            "continents_covered": 7,
-            "service_types": ["express", "standard", "economy", "ground", "air", "sea"],
-            "timestamp": datetime.now().isoformat()
-        }
-    }
+    return Response(
+        _CARRIERS_BODY_PREFIX + b',"timestamp":' + orjson.dumps(now_iso()) + b'}}',
+        media_type="application/json"
+    )
 
 @router.get("/health")
 async def health_check():
     """
     Health check for Global Shipping Marketplace service
     """
-    return {
-        "status": "healthy",
-        "service": "Global Shipping Marketplace",
-        "features": [
-            "Daily Volume Bidding System",
-            "Consumer Shipping Transparency",
-            "Carrier Competition Platform",
-            "Sustainability Comparison",
-            "Global Logistics Optimization"
-        ],
-        "timestamp": datetime.now().isoformat(),
-        "version": "1.0.0"
-    } 
\ No newline at end of file
+    return Response(
+        _HEALTH_BODY_PREFIX + b',"timestamp":' + orjson.dumps(now_iso()) + b'}',
+        media_type="application/json"
+    ) 
\ No newline at end of file
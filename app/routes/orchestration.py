@@ -1,10 +1,12 @@
 from fastapi import APIRouter, HTTPException, Request, BackgroundTasks, Depends
-from pydantic import BaseModel, Field
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ValidationError
 from typing import Dict, Any, Optional
 from datetime import datetime
 import logging
 import asyncio
 from uuid import uuid4
+import numpy as np
 
 # Import services
 from app.services.classification_engine import TaskClassificationEngine
@@ -16,6 +18,10 @@ from app.models.orchestration.task_request import Task_Request
 from app.models.orchestration.agent_response import Agent_Response
 from app.models.orchestration.sair_loop import SAIR_Loop_Data
 from app.models.api_models import UserRequestModel, ProcessingResponseModel, RequestStatus
+from app.models.batch_ingress import user_request_batcher
+from app.models.wire import WireDecodeError, decode_user_request
+from app.responses import ORJSONResponse
+from app.clock import utc_now
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,6 +29,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["orchestration"])
 
+# Placeholder embedding attached to mock agent responses
+_MOCK_EMBEDDING = np.array([0.1, 0.2, 0.3, 0.4, 0.5], dtype=np.float32)
+
 # Error response model for consistent error handling
 class ErrorResponse(BaseModel):
     error: str
@@ -54,9 +63,18 @@ async def get_db_connection(request: Request):
         return MockDB()
     return request.app.state.mongodb
 
-@router.post("/process-request", response_model=ProcessingResponseModel, status_code=202)
+@router.post(
+    "/process-request",
+    response_model=ProcessingResponseModel,
+    status_code=202,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": UserRequestModel.model_json_schema()}},
+        }
+    },
+)
 async def process_request(
-    user_request: UserRequestModel,
     background_tasks: BackgroundTasks,
     request: Request,
     db=Depends(get_db_connection)
@@ -71,6 +89,17 @@ async def process_request(
     4. Returns immediate response with routing decision
     5. Processes agent responses asynchronously
     """
+    # The body is decoded from raw bytes; validation then runs in the shared
+    # ingress batcher rather than per request
+    try:
+        payload = decode_user_request(await request.body())
+    except WireDecodeError as e:
+        raise RequestValidationError([{"type": e.error_type, "loc": ("body",), "msg": e.msg, "input": None}])
+    try:
+        user_request = await user_request_batcher.submit(payload)
+    except ValidationError as e:
+        raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in e.errors()])
+    
     request_id = str(uuid4())
     start_time = datetime.utcnow()
     
@@ -98,7 +127,7 @@ async def process_request(
             )
         
         # Step 3: Create Task_Request instance
-        task_request = Task_Request(
+        task_request = Task_Request.build_trusted(
             request_id=request_id,
             user_id=user_request.user_id,
             input_text=user_request.input_text,
@@ -109,7 +138,7 @@ async def process_request(
         
         # Step 4: Store in MongoDB
         try:
-            await db["task_requests"].insert_one(task_request.dict())
+            await db["task_requests"].insert_one(task_request.model_dump())
             logger.info(f"Task request {request_id} stored in database")
         except Exception as db_error:
             logger.error(f"Database error storing task request: {str(db_error)}")
@@ -141,7 +170,7 @@ async def process_request(
             estimated_response_time = f"{minutes}-{minutes + 1} minutes"
         
         # Step 7: Return immediate response using ProcessingResponseModel
-        response = ProcessingResponseModel(
+        response = ProcessingResponseModel.build_trusted(
             request_id=request_id,
             status=RequestStatus.PROCESSING,
             classification_results=classification_results.get("classification_results", {}),
@@ -154,12 +183,14 @@ async def process_request(
             },
             estimated_response_time=estimated_response_time,
             confidence=classification_results.get("confidence", 0.0),
-            timestamp=datetime.utcnow(),
+            timestamp=utc_now(),
             message="Request accepted and being processed"
         )
         
         logger.info(f"Request {request_id} processed successfully in {processing_time:.3f}s")
-        return response
+        # Already validated by construction; render directly instead of
+        # round-tripping through jsonable_encoder
+        return ORJSONResponse(response.model_dump(mode="json"), status_code=202)
         
     except HTTPException:
         # Re-raise HTTP exceptions
@@ -209,19 +240,19 @@ async def process_agent_responses(
                 response_content = f"Processed request: {input_text[:100]}..."
             
             # Create Agent_Response instance
-            agent_response = Agent_Response(
+            agent_response = Agent_Response.from_array(
+                _MOCK_EMBEDDING,
                 response_id=str(uuid4()),
                 request_id=request_id,
                 agent_id=agent_id,
                 response_content=response_content,
                 response_confidence=0.85 + (hash(agent_id) % 15) / 100,  # Random confidence 0.85-1.0
                 processing_time=processing_time,
-                vector_embedding=[0.1, 0.2, 0.3, 0.4, 0.5],  # Mock embedding
                 created_at=datetime.utcnow()
             )
             
             # Store in MongoDB
-            await db["agent_responses"].insert_one(agent_response.dict())
+            await db["agent_responses"].insert_one(agent_response.model_dump())
             responses.append(agent_response)
             
             logger.info(f"Agent {agent_id} response stored for request {request_id}")
@@ -273,7 +304,7 @@ async def update_sair_loop_with_feedback(
             timestamp=datetime.utcnow()
         )
         
-        await db["sair_loop_data"].insert_one(sair_loop_data.dict())
+        await db["sair_loop_data"].insert_one(sair_loop_data.model_dump())
         
         logger.info(f"SAIR loop updated for request {request_id}")
         
@@ -3,7 +3,7 @@ from fastapi.responses import JSONResponse
 from typing import List, Optional, Dict, Any
 import json
 import logging
-from datetime import datetime
+from app.clock import utc_now
 from collections import defaultdict
 
 from app.models.video_conference import (
@@ -165,7 +165,7 @@ async def update_conference(conference_id: str, request: ConferenceUpdateRequest
             if hasattr(conference, field):
                 setattr(conference, field, value)
         
-        conference.updated_at = datetime.utcnow()
+        conference.updated_at = utc_now()
         
         logger.info(f"📝 Updated conference {conference_id}")
         
@@ -324,7 +324,7 @@ async def websocket_endpoint(websocket: WebSocket, conference_id: str, participa
                 join_message = {
                     "type": "participant_joined",
                     "participant_id": participant_id,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_now().isoformat()
                 }
                 await manager.broadcast_to_conference(
                     json.dumps(join_message),
@@ -338,7 +338,7 @@ async def websocket_endpoint(websocket: WebSocket, conference_id: str, participa
                     "type": "chat_message",
                     "participant_id": participant_id,
                     "message": message.get("message", ""),
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_now().isoformat()
                 }
                 await manager.broadcast_to_conference(
                     json.dumps(chat_message),
@@ -381,7 +381,7 @@ async def websocket_endpoint(websocket: WebSocket, conference_id: str, participa
                     "type": "speaking_indicator",
                     "participant_id": participant_id,
                     "is_speaking": message.get("is_speaking", False),
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_now().isoformat()
                 }
                 await manager.broadcast_to_conference(
                     json.dumps(speaking_message),
@@ -395,7 +395,7 @@ async def websocket_endpoint(websocket: WebSocket, conference_id: str, participa
                     "type": "connection_quality",
                     "participant_id": participant_id,
                     "quality": message.get("quality", 1.0),
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_now().isoformat()
                 }
                 await manager.broadcast_to_conference(
                     json.dumps(quality_message),
@@ -414,7 +414,7 @@ async def websocket_endpoint(websocket: WebSocket, conference_id: str, participa
         leave_message = {
             "type": "participant_left",
             "participant_id": participant_id,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now().isoformat()
         }
         await manager.broadcast_to_conference(
             json.dumps(leave_message),
@@ -442,7 +442,7 @@ async def video_conference_health():
             "status": "healthy",
             "active_conferences": active_conferences,
             "total_conferences": total_conferences,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now().isoformat()
         }
         
     except Exception as e:
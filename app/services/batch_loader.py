@@ -0,0 +1,65 @@
+"""
+SEEKER Batch Loader
+Coalesces concurrent single-key reads into one batched database query
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from app.batching import MicroBatcher
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Dashboard bursts arrive within a few milliseconds of each other; the window
+# only has to be long enough to catch one burst
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_WAIT_MS = 25.0
+
+class BatchLoader(MicroBatcher[K]):
+    """
+    Loads values by key, batching concurrent loads into one call.
+
+    Each batch's distinct keys are passed to load_many in one call. Each
+    caller receives the value for its key, or None if load_many returned
+    nothing for it; an error from load_many is raised to every caller in
+    that batch.
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ):
+        super().__init__(max_batch, max_wait_ms)
+        self.load_many = load_many
+
+    async def load(self, key: K) -> Optional[V]:
+        """Queue a key and wait for its value from the next batch"""
+        return await self._submit(key)
+
+    async def _process(self, batch: List[Tuple[K, asyncio.Future]]):
+        waiting: Dict[K, List[asyncio.Future]] = {}
+        for key, future in batch:
+            if not future.done():
+                waiting.setdefault(key, []).append(future)
+        if not waiting:
+            return
+        try:
+            values = await self.load_many(list(waiting))
+        except Exception as e:
+            logger.error("Batch load of %d keys failed: %s", len(waiting), e)
+            for futures in waiting.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for key, futures in waiting.items():
+            value = values.get(key)
+            for future in futures:
+                if not future.done():
+                    future.set_result(value)
@@ -10,6 +10,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
 import pandas as pd
 import numpy as np
@@ -80,6 +81,17 @@ class MarketComparison:
     best_value_supplier: Dict[str, Any]
     cost_transparency_rankings: List[Dict[str, Any]]
     consumer_insights: List[str]
+    
+    @cached_property
+    def transparency_scores(self) -> np.ndarray:
+        """Transparency scores of the ranked suppliers, gathered once"""
+        rankings = self.cost_transparency_rankings
+        return np.fromiter((r['transparency_score'] for r in rankings), dtype=np.float64, count=len(rankings))
+    
+    @cached_property
+    def transparency_avg(self) -> float:
+        """Average transparency score, computed once per comparison"""
+        return float(self.transparency_scores.mean())
 
 class SEEKERConsumerMarketplace:
     """
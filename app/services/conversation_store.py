@@ -0,0 +1,188 @@
+"""
+SEEKER Conversation Message Store
+Bounded in-memory message window with an append-only SQLite archive
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Set
+
+from app.models.conversation import MESSAGE_LIST_ADAPTER, ConversationMessage, ConversationSession
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_PATH = os.getenv("SEEKER_CONVERSATION_ARCHIVE", "conversation_archive.sqlite3")
+MAX_ACTIVE_SESSIONS = int(os.getenv("SEEKER_MAX_SESSIONS", "10000"))
+
+def _process_archive_path() -> str:
+    """Return this process's archive file, so server workers never share one"""
+    root, ext = os.path.splitext(DEFAULT_ARCHIVE_PATH)
+    return f"{root}.{os.getpid()}{ext}"
+
+class SessionCache:
+    """Bounded map of live sessions; the least recently used one is dropped when full"""
+
+    def __init__(
+        self,
+        maxsize: int = MAX_ACTIVE_SESSIONS,
+        on_evict: Optional[Callable[[ConversationSession], None]] = None,
+    ):
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self._sessions: "OrderedDict[str, ConversationSession]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, session_id: str) -> Optional[ConversationSession]:
+        """Return the session and mark it recently used, or None if unknown"""
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def add(self, session: ConversationSession):
+        self._sessions[session.session_id] = session
+        self._sessions.move_to_end(session.session_id)
+        if len(self._sessions) > self.maxsize:
+            evicted_id, evicted = self._sessions.popitem(last=False)
+            logger.info(f"Evicted idle conversation {evicted_id}")
+            if self.on_evict is not None:
+                self.on_evict(evicted)
+
+class ConversationMessageStore:
+    """Keeps each session's hot tail in memory and pages older messages to disk"""
+
+    def __init__(self, archive_path: Optional[str] = None):
+        # Without an explicit path the per-process file is chosen on first use,
+        # after any worker fork
+        self._archive_path = archive_path
+        self._connection = None
+        self._lock = threading.Lock()
+        # Serializes archive writes so two adds to a full window never page
+        # out the same position
+        self._write_lock = asyncio.Lock()
+        self._pending_deletes: Set[asyncio.Task] = set()
+
+    @property
+    def archive_path(self) -> str:
+        if self._archive_path is None:
+            self._archive_path = _process_archive_path()
+        return self._archive_path
+
+    @property
+    def archive_ref(self) -> str:
+        return f"sqlite:///{self.archive_path}"
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.archive_path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS conversation_messages ("
+                " session_id TEXT NOT NULL,"
+                " position INTEGER NOT NULL,"
+                " message_id TEXT NOT NULL,"
+                " user_input TEXT NOT NULL,"
+                " system_response TEXT NOT NULL,"
+                " timestamp INTEGER NOT NULL,"
+                " PRIMARY KEY (session_id, position))"
+            )
+            # Sessions only live in memory, so rows left by a previous process
+            # with the same archive file can never be read again
+            with self._connection:
+                self._connection.execute("DELETE FROM conversation_messages")
+            logger.info(f"✅ Conversation archive opened at {self.archive_path}")
+        return self._connection
+
+    def _archive(self, session_id: str, position: int, message: ConversationMessage):
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "INSERT INTO conversation_messages VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        session_id,
+                        position,
+                        message.message_id,
+                        message.user_input,
+                        message.system_response,
+                        message.timestamp,
+                    ),
+                )
+
+    def _delete_archive(self, session_id: str):
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute("DELETE FROM conversation_messages WHERE session_id = ?", (session_id,))
+
+    async def add_message(self, session: ConversationSession, message: ConversationMessage):
+        """Append a message, paging the oldest in-memory one out when the window is full"""
+        window = session.recent_messages
+        if window.maxlen is None or len(window) < window.maxlen:
+            window.append(message)
+            session.message_count += 1
+            return
+        async with self._write_lock:
+            # The oldest message is written before it leaves the window, so a
+            # concurrent page read finds it in one place or the other
+            position = session.message_count - len(window)
+            await asyncio.to_thread(self._archive, session.session_id, position, window[0])
+            session.archive_ref = self.archive_ref
+            window.append(message)
+            session.message_count += 1
+
+    def discard_session(self, session: ConversationSession):
+        """Drop a session's archived messages once the session itself is gone"""
+        if session.archive_ref is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._delete_archive(session.session_id)
+            return
+        task = loop.create_task(asyncio.to_thread(self._delete_archive, session.session_id))
+        self._pending_deletes.add(task)
+        task.add_done_callback(self._pending_deletes.discard)
+
+    def _read_archive(self, session_id: str, offset: int, limit: int) -> List[ConversationMessage]:
+        with self._lock:
+            rows = self._get_connection().execute(
+                "SELECT message_id, user_input, system_response, timestamp"
+                " FROM conversation_messages WHERE session_id = ?"
+                " ORDER BY position LIMIT ? OFFSET ?",
+                (session_id, limit, offset),
+            ).fetchall()
+        return MESSAGE_LIST_ADAPTER.validate_python([
+            {
+                "message_id": message_id,
+                "user_input": user_input,
+                "system_response": system_response,
+                "timestamp": timestamp,
+            }
+            for message_id, user_input, system_response, timestamp in rows
+        ])
+
+    async def load_page(self, session: ConversationSession, offset: int, limit: int) -> List[ConversationMessage]:
+        """Return messages [offset, offset + limit) in chronological order"""
+        # Snapshot the window first: it may shift while the archive is read
+        window = list(session.recent_messages)
+        archived = session.message_count - len(window)
+        page: List[ConversationMessage] = []
+        if offset < archived:
+            # Only touch the archive when the page reaches past the window
+            page = await asyncio.to_thread(
+                self._read_archive, session.session_id, offset, min(limit, archived - offset)
+            )
+        start = max(offset - archived, 0)
+        remaining = limit - len(page)
+        if remaining > 0:
+            page.extend(window[start:start + remaining])
+        return page
+
+# Global store instance
+conversation_message_store = ConversationMessageStore()
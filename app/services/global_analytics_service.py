@@ -8,7 +8,7 @@ import aiohttp
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import pandas as pd
@@ -16,8 +16,30 @@ import numpy as np
 from motor.motor_asyncio import AsyncIOMotorClient
 from fastapi import HTTPException
 
+from app.clock import now_iso
+from app.services.batch_loader import BatchLoader
+
 logger = logging.getLogger(__name__)
 
+# Indexes backing the per-(industry, product_category) dashboard reads: the
+# equality prefix selects the key, the trailing field serves the recency sort
+ANALYTICS_INDEXES = {
+    'market_data': [('industry', 1), ('product_category', 1), ('last_updated', -1)],
+    'analytics_results': [('industry', 1), ('product_category', 1), ('analysis_timestamp', -1)],
+}
+
+# Fields returned per supplier by the reliability view
+_RELIABILITY_PROJECTION = {
+    '_id': 0, 'supplier_name': 1, 'continent': 1, 'country': 1, 'reliability_score': 1,
+    'quality_score': 1, 'price_usd': 1, 'lead_time_days': 1
+}
+
+async def ensure_analytics_indexes(mongo_client: AsyncIOMotorClient):
+    """Create the global analytics indexes; a no-op when they already exist"""
+    db = mongo_client.seeker_global_analytics
+    for collection, keys in ANALYTICS_INDEXES.items():
+        await db[collection].create_index(keys)
+
 class Continent(Enum):
     NORTH_AMERICA = "north_america"
     EUROPE = "europe"
@@ -49,6 +71,14 @@ class MarketData:
     last_updated: datetime
     data_source: DataSource
 
+@dataclass
+class MarketSummary:
+    total_suppliers: int
+    continents_covered: int
+    average_price_usd: float
+    compliance_rate: float
+    top_suppliers: List[str]
+
 @dataclass
 class AnalyticsResult:
     market_penetration: float
@@ -57,6 +87,7 @@ class AnalyticsResult:
     supply_chain_routes: List[Dict[str, Any]]
     compliance_status: Dict[str, bool]
     opportunity_score: float
+    summary: MarketSummary
 
 class SEEKERGlobalAnalyticsService:
     """
@@ -73,6 +104,11 @@ class SEEKERGlobalAnalyticsService:
             'pricing_history': self.db.pricing_history
         }
         
+        # Concurrent dashboard reads for many (industry, product_category)
+        # pairs are coalesced into one query per loader
+        self._latest_result_loader = BatchLoader(self._load_latest_results)
+        self._reliability_loader = BatchLoader(self._load_reliability_scores)
+        
         # Data collection APIs configuration
         self.data_sources = {
             Continent.NORTH_AMERICA: {
@@ -113,6 +149,13 @@ class SEEKERGlobalAnalyticsService:
         
         logger.info("🌍 SEEKER Global Analytics Service initialized")
     
+    async def close(self):
+        """
+        Stop the batch loaders' worker tasks
+        """
+        await self._latest_result_loader.close()
+        await self._reliability_loader.close()
+    
     async def collect_global_market_data(self, industry: str, product_category: str) -> List[MarketData]:
         """
         Collect market data from all continents for specified industry and product category
@@ -356,6 +399,7 @@ class SEEKERGlobalAnalyticsService:
         supply_chain_routes = self._analyze_supply_chain_routes(market_data)
         compliance_status = self._check_compliance_status(market_data)
         opportunity_score = self._calculate_opportunity_score(market_data)
+        summary = self._summarize_market(market_data, competitive_landscape, price_quality_matrix, compliance_status)
         
         result = AnalyticsResult(
             market_penetration=market_penetration,
@@ -363,7 +407,8 @@ class SEEKERGlobalAnalyticsService:
             price_quality_matrix=price_quality_matrix,
             supply_chain_routes=supply_chain_routes,
             compliance_status=compliance_status,
-            opportunity_score=opportunity_score
+            opportunity_score=opportunity_score,
+            summary=summary
         )
         
         # Store analysis result
@@ -372,6 +417,26 @@ class SEEKERGlobalAnalyticsService:
         logger.info(f"✅ Global market analysis completed for {industry} - {product_category}")
         return result
     
+    def _summarize_market(
+        self,
+        market_data: List[MarketData],
+        competitive_landscape: Dict[str, Any],
+        price_quality_matrix: Dict[str, float],
+        compliance_status: Dict[str, bool]
+    ) -> MarketSummary:
+        """Derive the dashboard summary scalars from the already computed analysis"""
+        total_suppliers = len(market_data)
+        average_price = sum(d.price_usd for d in market_data) / total_suppliers if total_suppliers else 0.0
+        compliance_rate = sum(compliance_status.values()) / len(compliance_status) * 100 if compliance_status else 0.0
+        
+        return MarketSummary(
+            total_suppliers=total_suppliers,
+            continents_covered=len(competitive_landscape),
+            average_price_usd=round(average_price, 2),
+            compliance_rate=compliance_rate,
+            top_suppliers=list(price_quality_matrix)[:5]
+        )
+    
     def _calculate_market_penetration(self, market_data: List[MarketData]) -> float:
         """Calculate market penetration score"""
         total_suppliers = len(market_data)
@@ -508,10 +573,7 @@ class SEEKERGlobalAnalyticsService:
     async def get_global_heatmap_data(self, industry: str, product_category: str) -> Dict[str, Any]:
         """Get data for global heatmap visualization"""
         # Get latest analytics result
-        result = await self.collections['analytics_results'].find_one(
-            {'industry': industry, 'product_category': product_category},
-            sort=[('analysis_timestamp', -1)]
-        )
+        result = await self._latest_result_loader.load((industry, product_category))
         
         if not result:
             # Perform fresh analysis
@@ -526,30 +588,55 @@ class SEEKERGlobalAnalyticsService:
             'heatmap_data': result['competitive_landscape'],
             'opportunity_score': result['opportunity_score'],
             'market_penetration': result['market_penetration'],
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso()
         }
     
     async def get_supplier_reliability_scores(self, industry: str, product_category: str) -> List[Dict[str, Any]]:
         """Get supplier reliability scores for visualization"""
-        # Get market data
-        market_data = await self.collections['market_data'].find({
-            'industry': industry,
-            'product_category': product_category
-        }).sort('last_updated', -1).limit(100).to_list(length=100)
-        
-        suppliers = []
-        for data in market_data:
-            suppliers.append({
-                'supplier_name': data['supplier_name'],
-                'continent': data['continent'],
-                'country': data['country'],
-                'reliability_score': data['reliability_score'],
-                'quality_score': data['quality_score'],
-                'price_usd': data['price_usd'],
-                'lead_time_days': data['lead_time_days']
-            })
-        
-        return suppliers 
+        suppliers = await self._reliability_loader.load((industry, product_category))
+        return suppliers or []
+    
+    @staticmethod
+    def _match_keys(keys: List[Tuple[str, str]]) -> Dict[str, Any]:
+        return {'$match': {'$or': [
+            {'industry': industry, 'product_category': product_category}
+            for industry, product_category in keys
+        ]}}
+    
+    async def _load_latest_results(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Latest stored analytics result for each (industry, product_category) key"""
+        pipeline = [
+            self._match_keys(keys),
+            {'$project': {
+                'industry': 1, 'product_category': 1, 'analysis_timestamp': 1,
+                'competitive_landscape': 1, 'opportunity_score': 1, 'market_penetration': 1
+            }},
+            {'$sort': {'analysis_timestamp': -1}},
+            {'$group': {
+                '_id': {'industry': '$industry', 'product_category': '$product_category'},
+                'competitive_landscape': {'$first': '$competitive_landscape'},
+                'opportunity_score': {'$first': '$opportunity_score'},
+                'market_penetration': {'$first': '$market_penetration'}
+            }}
+        ]
+        docs = await self.collections['analytics_results'].aggregate(pipeline).to_list(length=None)
+        return {(doc['_id']['industry'], doc['_id']['product_category']): doc for doc in docs}
+    
+    async def _load_reliability_scores(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        """The 100 most recently updated suppliers for each (industry, product_category) key"""
+        # One indexed, limited find per key rather than a $group over every
+        # matching supplier, which has no upper bound on its memory use
+        collection = self.collections['market_data']
+        
+        async def load(industry: str, product_category: str) -> List[Dict[str, Any]]:
+            cursor = collection.find(
+                {'industry': industry, 'product_category': product_category},
+                _RELIABILITY_PROJECTION
+            ).sort('last_updated', -1).limit(100)
+            return await cursor.to_list(length=100)
+        
+        results = await asyncio.gather(*(load(industry, product_category) for industry, product_category in keys))
+        return {key: suppliers for key, suppliers in zip(keys, results) if suppliers}
 
     async def get_advanced_market_insights(self, industry: str, product_category: str) -> Dict[str, Any]:
         """
@@ -1,7 +1,7 @@
 import asyncio
 import json
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Dict, List, Optional, Set, Any
 from collections import defaultdict
 import uuid
@@ -13,6 +13,7 @@ from app.models.video_conference import (
 )
 from app.services.classification_engine import TaskClassificationEngine as ClassificationEngine
 from app.services.agent_router import AgentRouter
+from app.clock import utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -102,17 +103,17 @@ class VideoConferenceService:
                 language=participant_data.get("language", "en-US"),
                 timezone=participant_data.get("timezone", "UTC"),
                 is_host=participant_data.get("is_host", False),
-                joined_at=datetime.utcnow()
+                joined_at=utc_now()
             )
             
             # Add to conference
-            conference.participants.append(participant)
-            conference.updated_at = datetime.utcnow()
+            conference.add_participant(participant)
+            conference.updated_at = utc_now()
             
             # Initialize session data
             self.participant_sessions[conference_id][participant.id] = {
-                "joined_at": datetime.utcnow(),
-                "last_activity": datetime.utcnow(),
+                "joined_at": utc_now(),
+                "last_activity": utc_now(),
                 "connection_quality": 1.0,
                 "translation_requests": 0,
                 "messages_sent": 0
@@ -121,7 +122,7 @@ class VideoConferenceService:
             # Start conference if first participant joins
             if len(conference.participants) == 1 and conference.status == ConferenceStatus.SCHEDULED:
                 conference.status = ConferenceStatus.ACTIVE
-                conference.actual_start = datetime.utcnow()
+                conference.actual_start = utc_now()
             
             logger.info(f"Participant {participant.name} joined conference {conference_id}")
             return participant
@@ -137,17 +138,17 @@ class VideoConferenceService:
                 return False
             
             conference = self.conferences[conference_id]
-            participant = next((p for p in conference.participants if p.id == participant_id), None)
+            participant = conference.get_participant(participant_id)
             
             if not participant:
                 return False
             
             # Update participant
-            participant.left_at = datetime.utcnow()
+            participant.left_at = utc_now()
             participant.is_speaking = False
             
             # Remove from active participants
-            conference.participants = [p for p in conference.participants if p.id != participant_id]
+            conference.remove_participant(participant_id)
             
             # Clean up session data
             if participant_id in self.participant_sessions[conference_id]:
@@ -156,9 +157,9 @@ class VideoConferenceService:
             # End conference if no participants left
             if len(conference.participants) == 0:
                 conference.status = ConferenceStatus.ENDED
-                conference.actual_end = datetime.utcnow()
+                conference.actual_end = utc_now()
             
-            conference.updated_at = datetime.utcnow()
+            conference.updated_at = utc_now()
             
             logger.info(f"Participant {participant.name} left conference {conference_id}")
             return True
@@ -369,7 +370,7 @@ class VideoConferenceService:
             
             duration_minutes = 0
             if conference.actual_start:
-                end_time = conference.actual_end or datetime.utcnow()
+                end_time = conference.actual_end or utc_now()
                 duration_minutes = int((end_time - conference.actual_start).total_seconds() / 60)
             
             messages_sent = sum(session.get("messages_sent", 0) for session in session_data.values())
@@ -401,7 +402,7 @@ class VideoConferenceService:
         """Background task to cleanup expired conferences"""
         while True:
             try:
-                current_time = datetime.utcnow()
+                current_time = utc_now()
                 expired_conferences = []
                 
                 for conference_id, conference in self.conferences.items():
@@ -441,7 +442,7 @@ class VideoConferenceService:
                         # Update participant connection quality
                         if conference_id in self.conferences:
                             conference = self.conferences[conference_id]
-                            participant = next((p for p in conference.participants if p.id == participant_id), None)
+                            participant = conference.get_participant(participant_id)
                             if participant:
                                 participant.connection_quality = session["connection_quality"]
                 
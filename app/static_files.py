@@ -0,0 +1,53 @@
+"""
+Static asset serving for SEEKER AI Orchestration System
+"""
+
+import hashlib
+import os
+import re
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+# Fingerprinted assets (e.g. app.3f9c2a1b.js) never change under the same name
+HASHED_ASSET_PATTERN = re.compile(r"\.[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+def static_etag(stat_result: os.stat_result) -> str:
+    """Cheap ETag derived from file mtime and size"""
+    digest = hashlib.blake2b(
+        f"{stat_result.st_mtime_ns}-{stat_result.st_size}".encode(), digest_size=8
+    )
+    return f'"{digest.hexdigest()}"'
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with cache-control and cheap ETags
+
+    Conditional requests are answered with 304 from the stat result alone,
+    so unchanged assets are never opened.
+    """
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        if HASHED_ASSET_PATTERN.search(str(full_path)):
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            cache_control = REVALIDATE_CACHE_CONTROL
+
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            stat_result=stat_result,
+            headers={"cache-control": cache_control, "etag": static_etag(stat_result)},
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
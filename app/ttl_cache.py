@@ -0,0 +1,64 @@
+"""
+SEEKER TTL Cache
+Per-key single-flight cache for results that stay valid for a fixed time
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+class TTLCache(Generic[K, V]):
+    """
+    Caches awaited results by key for ttl seconds, computing each one once.
+
+    Concurrent callers for a missing or stale key wait on a per-key lock
+    while the first one computes; the lock is dropped as soon as nobody
+    holds it, whether the compute succeeded or raised. Failures are not
+    cached. Beyond maxsize entries the least recently stored one is evicted.
+    clock is read for entry ages and can be replaced, e.g. in tests.
+    """
+
+    def __init__(self, ttl: float, maxsize: int, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.clock = clock
+        self._entries: Dict[K, Tuple[float, V]] = {}
+        self._locks: Dict[K, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self._locks.clear()
+
+    def _fresh(self, key: K):
+        cached = self._entries.get(key)
+        if cached is not None and self.clock() - cached[0] < self.ttl:
+            return cached
+        return None
+
+    async def get_or_compute(self, key: K, compute: Callable[[], Awaitable[V]]) -> V:
+        """Return a recent value for key, awaiting compute() once while it is missing or stale"""
+        cached = self._fresh(key)
+        if cached is not None:
+            return cached[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._fresh(key)
+                if cached is not None:
+                    return cached[1]
+                value = await compute()
+                self._entries.pop(key, None)
+                self._entries[key] = (self.clock(), value)
+                if len(self._entries) > self.maxsize:
+                    del self._entries[next(iter(self._entries))]
+        finally:
+            if self._locks.get(key) is lock and not lock.locked():
+                del self._locks[key]
+        return value
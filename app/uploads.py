@@ -0,0 +1,26 @@
+"""
+Streaming upload storage for SEEKER file routes
+"""
+
+import asyncio
+import hashlib
+from typing import Tuple
+
+import aiofiles
+from fastapi import UploadFile
+
+# Uploads are streamed to disk in chunks of this size rather than read whole,
+# so memory per upload stays at one small buffer however large the file is
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+async def save_upload(file: UploadFile, dest: str) -> Tuple[int, str]:
+    """Stream an upload to dest, sizing and hashing it on the way through; returns (size, sha256 hex)"""
+    size = 0
+    hasher = hashlib.sha256()
+    async with aiofiles.open(dest, "wb") as out:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            # OpenSSL's SHA-256 releases the GIL on large buffers, so hash in a
+            # worker thread while the chunk is written instead of on the loop
+            await asyncio.gather(asyncio.to_thread(hasher.update, chunk), out.write(chunk))
+    return size, hasher.hexdigest()
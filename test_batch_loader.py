@@ -0,0 +1,89 @@
+"""
+Tests for the SEEKER batch loader behind the heatmap and supplier reliability reads
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.batch_loader import BatchLoader
+
+
+class _Source:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def load_many(self, keys):
+        self.batches.append(list(keys))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("database down")
+        return {key: f"value-{key}" for key in keys if key != "missing"}
+
+
+def test_concurrent_loads_share_one_batch():
+    source = _Source()
+    loader = BatchLoader(source.load_many, max_batch=8)
+
+    async def run():
+        return await asyncio.gather(*(loader.load(f"k{i}") for i in range(5)))
+
+    assert asyncio.run(run()) == [f"value-k{i}" for i in range(5)]
+    assert source.batches == [[f"k{i}" for i in range(5)]]
+
+
+def test_batches_are_capped_at_max_batch():
+    source = _Source()
+    loader = BatchLoader(source.load_many, max_batch=2)
+
+    async def run():
+        return await asyncio.gather(*(loader.load(f"k{i}") for i in range(5)))
+
+    assert asyncio.run(run()) == [f"value-k{i}" for i in range(5)]
+    assert [len(batch) for batch in source.batches] == [2, 2, 1]
+
+
+def test_duplicate_keys_are_loaded_once_and_fanned_out():
+    source = _Source()
+    loader = BatchLoader(source.load_many)
+
+    async def run():
+        return await asyncio.gather(loader.load("a"), loader.load("b"), loader.load("a"), loader.load("missing"))
+
+    assert asyncio.run(run()) == ["value-a", "value-b", "value-a", None]
+    assert source.batches == [["a", "b", "missing"]]
+
+
+def test_load_error_reaches_every_caller_and_worker_survives():
+    source = _Source(fail=True)
+    loader = BatchLoader(source.load_many)
+
+    async def run():
+        results = await asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+        source.fail = False
+        return results, await asyncio.wait_for(loader.load("c"), timeout=1.0)
+
+    results, after = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert after == "value-c"
+
+
+def test_close_stops_worker_and_cancels_waiting_loads():
+    async def run():
+        entered = asyncio.Event()
+
+        async def load_many(keys):
+            entered.set()
+            await asyncio.sleep(10)
+
+        loader = BatchLoader(load_many)
+        pending = asyncio.ensure_future(loader.load("a"))
+        await entered.wait()
+        worker = loader._worker
+        await loader.close()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+        return worker
+
+    assert asyncio.run(run()).done()
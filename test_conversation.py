@@ -66,7 +66,7 @@ def test_conversation_endpoints():
         response = requests.get(f"{BASE_URL}/api/v1/conversation/conversations/{session_id}")
         if response.status_code == 200:
             conversation_data = response.json()
-            message_count = len(conversation_data.get("messages", []))
+            message_count = conversation_data.get("message_count", 0)
             print(f"✅ GET /api/v1/conversation/conversations/{session_id} - 200 - Conversation has {message_count} messages")
         else:
             print(f"❌ GET /api/v1/conversation/conversations/{session_id} - {response.status_code} - Failed")
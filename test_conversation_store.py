@@ -0,0 +1,106 @@
+"""
+Tests for the SEEKER conversation message store (bounded window + SQLite archive)
+"""
+
+import asyncio
+
+from app.models.conversation import RECENT_MESSAGE_WINDOW, ConversationMessage, ConversationSession
+from app.services import conversation_store
+from app.services.conversation_store import ConversationMessageStore, SessionCache
+
+
+def _message(i: int) -> ConversationMessage:
+    return ConversationMessage(message_id=f"m{i}", user_input=f"in {i}", system_response=f"out {i}")
+
+
+def _fill(store: ConversationMessageStore, session: ConversationSession, count: int):
+    async def run():
+        for i in range(count):
+            await store.add_message(session, _message(i))
+    asyncio.run(run())
+
+
+def test_window_pages_oldest_messages_to_archive(tmp_path):
+    store = ConversationMessageStore(str(tmp_path / "archive.sqlite3"))
+    session = ConversationSession(session_id="s1", user_id="u1")
+    total = RECENT_MESSAGE_WINDOW + 10
+    _fill(store, session, total)
+
+    assert session.message_count == total
+    assert len(session.recent_messages) == RECENT_MESSAGE_WINDOW
+    assert session.archive_ref == store.archive_ref
+
+    page = asyncio.run(store.load_page(session, 0, total))
+    assert [m.message_id for m in page] == [f"m{i}" for i in range(total)]
+
+
+def test_page_spanning_archive_and_window(tmp_path):
+    store = ConversationMessageStore(str(tmp_path / "archive.sqlite3"))
+    session = ConversationSession(session_id="s1", user_id="u1")
+    _fill(store, session, RECENT_MESSAGE_WINDOW + 10)
+
+    page = asyncio.run(store.load_page(session, 5, 10))
+    assert [m.message_id for m in page] == [f"m{i}" for i in range(5, 15)]
+
+
+def test_concurrent_adds_keep_every_message(tmp_path):
+    store = ConversationMessageStore(str(tmp_path / "archive.sqlite3"))
+    session = ConversationSession(session_id="s1", user_id="u1")
+    total = RECENT_MESSAGE_WINDOW * 2
+
+    async def run():
+        await asyncio.gather(*(store.add_message(session, _message(i)) for i in range(total)))
+        return await store.load_page(session, 0, total)
+
+    page = asyncio.run(run())
+    assert sorted(m.message_id for m in page) == sorted(f"m{i}" for i in range(total))
+
+
+def test_evicted_session_archive_is_deleted(tmp_path):
+    store = ConversationMessageStore(str(tmp_path / "archive.sqlite3"))
+    cache = SessionCache(maxsize=1, on_evict=store.discard_session)
+    session = ConversationSession(session_id="s1", user_id="u1")
+    cache.add(session)
+    _fill(store, session, RECENT_MESSAGE_WINDOW + 3)
+
+    cache.add(ConversationSession(session_id="s2", user_id="u1"))
+
+    assert cache.get("s1") is None
+    rows = store._get_connection().execute(
+        "SELECT COUNT(*) FROM conversation_messages WHERE session_id = 's1'"
+    ).fetchone()[0]
+    assert rows == 0
+
+
+def test_validated_session_window_is_bounded():
+    session = ConversationSession(
+        session_id="s1", user_id="u1", recent_messages=[_message(i) for i in range(3)]
+    )
+    assert session.recent_messages.maxlen == RECENT_MESSAGE_WINDOW
+
+
+def test_default_archive_is_per_process(tmp_path, monkeypatch):
+    monkeypatch.setattr(conversation_store, "DEFAULT_ARCHIVE_PATH", str(tmp_path / "archive.sqlite3"))
+    session = ConversationSession(session_id="s1", user_id="u1")
+
+    monkeypatch.setattr(conversation_store.os, "getpid", lambda: 101)
+    first = ConversationMessageStore()
+    _fill(first, session, RECENT_MESSAGE_WINDOW + 3)
+
+    # A second worker opening its archive later must not wipe the first one's
+    monkeypatch.setattr(conversation_store.os, "getpid", lambda: 102)
+    second = ConversationMessageStore()
+    second._get_connection()
+
+    assert first.archive_path != second.archive_path
+    page = asyncio.run(first.load_page(session, 0, 3))
+    assert [m.message_id for m in page] == ["m0", "m1", "m2"]
+
+
+def test_message_reads_back_its_own_json():
+    message = _message(1)
+    restored = ConversationMessage.model_validate_json(message.model_dump_json())
+    assert restored.timestamp == message.timestamp
+
+    iso = ConversationMessage(message_id="m", user_input="i", system_response="o", timestamp="1970-01-01T00:00:01+00:00")
+    assert iso.timestamp == 1000
@@ -0,0 +1,74 @@
+"""
+Tests for the SEEKER ingress request batcher
+"""
+
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.batch_ingress import RequestBatcher
+
+
+def _payload(**overrides):
+    payload = {"input_text": "optimize my python code", "user_id": "demo_user", "context": {"k": "v"}}
+    payload.update(overrides)
+    return payload
+
+
+def test_concurrent_submits_resolve_individually():
+    batcher = RequestBatcher(max_batch=4)
+
+    async def run():
+        return await asyncio.gather(
+            *(batcher.submit(_payload(user_id=f"user_{i}")) for i in range(10)),
+            batcher.submit(_payload(user_id="bad-id")),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert [r.user_id for r in results[:10]] == [f"user_{i}" for i in range(10)]
+    assert isinstance(results[10], ValidationError)
+
+
+def test_identical_payloads_do_not_share_context():
+    batcher = RequestBatcher()
+
+    async def run():
+        first = await batcher.submit(_payload())
+        first.context["k"] = "changed"
+        return await batcher.submit(_payload())
+
+    assert asyncio.run(run()).context == {"k": "v"}
+
+
+def test_worker_survives_unexpected_errors():
+    batcher = RequestBatcher()
+    validate = batcher._validate
+
+    def flaky(payload):
+        if payload.get("user_id") == "boom":
+            raise RuntimeError("boom")
+        return validate(payload)
+
+    batcher._validate = flaky
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await batcher.submit(_payload(user_id="boom"))
+        return await asyncio.wait_for(batcher.submit(_payload()), timeout=1.0)
+
+    assert asyncio.run(run()).user_id == "demo_user"
+
+
+def test_close_stops_worker_and_batcher_restarts_on_demand():
+    batcher = RequestBatcher()
+
+    async def run():
+        await batcher.submit(_payload())
+        worker = batcher._worker
+        await batcher.close()
+        assert worker.done()
+        return await asyncio.wait_for(batcher.submit(_payload()), timeout=1.0)
+
+    assert asyncio.run(run()).user_id == "demo_user"
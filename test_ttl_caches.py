@@ -0,0 +1,133 @@
+"""
+Tests for the per-key TTL caches in front of the global analytics and shipping routes
+"""
+
+import asyncio
+
+import pytest
+
+from app.routes import global_analytics, global_shipping
+from app.services.global_shipping_service import ShippingService
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    caches = (global_analytics._analysis_cache, global_shipping._quote_cache)
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+class _QuoteService:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    async def get_consumer_shipping_quote(self, origin, destination, weight_kg, volume_cm3, service_enum):
+        self.calls.append((origin, destination, weight_kg, volume_cm3, service_enum))
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("carrier down")
+        return {"weight_kg": weight_kg, "volume_cm3": volume_cm3}
+
+
+def test_analysis_computed_once_for_concurrent_callers():
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"score": 1}
+
+    async def run():
+        return await asyncio.gather(
+            *(global_analytics._cached_analysis("analysis", "tech", "ai", compute) for _ in range(5))
+        )
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(r == {"score": 1} for r in results)
+    assert global_analytics._analysis_cache._locks == {}
+
+
+def test_analysis_expires_after_ttl(monkeypatch):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return len(calls)
+
+    now = [1000.0]
+    monkeypatch.setattr(global_analytics._analysis_cache, "clock", lambda: now[0])
+    assert asyncio.run(global_analytics._cached_analysis("analysis", "tech", "ai", compute)) == 1
+    assert asyncio.run(global_analytics._cached_analysis("analysis", "tech", "ai", compute)) == 1
+    now[0] += global_analytics.ANALYSIS_CACHE_TTL
+    assert asyncio.run(global_analytics._cached_analysis("analysis", "tech", "ai", compute)) == 2
+
+
+def test_analysis_failure_releases_lock_and_caches_nothing():
+    async def compute():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(global_analytics._cached_analysis("analysis", "tech", "ai", compute))
+    assert global_analytics._analysis_cache._locks == {}
+    assert len(global_analytics._analysis_cache) == 0
+
+
+def test_quote_computed_once_for_concurrent_callers():
+    service = _QuoteService()
+
+    async def run():
+        return await asyncio.gather(
+            *(global_shipping._cached_quote(service, "US", "DE", 1.2345, 1000.4, ShippingService.EXPRESS)
+              for _ in range(5))
+        )
+
+    results = asyncio.run(run())
+    assert service.calls == [("US", "DE", 1.2345, 1000.4, ShippingService.EXPRESS)]
+    assert all(r == {"weight_kg": 1.2345, "volume_cm3": 1000.4} for r in results)
+    assert global_shipping._quote_cache._locks == {}
+
+
+def test_quote_not_shared_between_nearby_parcels():
+    service = _QuoteService()
+
+    async def run():
+        return await asyncio.gather(
+            global_shipping._cached_quote(service, "US", "DE", 1.2345, 1000.4, ShippingService.EXPRESS),
+            global_shipping._cached_quote(service, "US", "DE", 1.2301, 999.6, ShippingService.EXPRESS),
+        )
+
+    first, second = asyncio.run(run())
+    assert len(service.calls) == 2
+    assert first == {"weight_kg": 1.2345, "volume_cm3": 1000.4}
+    assert second == {"weight_kg": 1.2301, "volume_cm3": 999.6}
+
+
+def test_quote_keys_differ_by_service_and_expire(monkeypatch):
+    service = _QuoteService()
+    now = [1000.0]
+    monkeypatch.setattr(global_shipping._quote_cache, "clock", lambda: now[0])
+
+    def quote(service_enum):
+        return asyncio.run(global_shipping._cached_quote(service, "US", "DE", 2.0, 500.0, service_enum))
+
+    quote(ShippingService.EXPRESS)
+    quote(ShippingService.STANDARD)
+    quote(ShippingService.EXPRESS)
+    assert len(service.calls) == 2
+    now[0] += global_shipping.QUOTE_CACHE_TTL
+    quote(ShippingService.EXPRESS)
+    assert len(service.calls) == 3
+
+
+def test_quote_failure_releases_lock_and_caches_nothing():
+    service = _QuoteService(fail=True)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(global_shipping._cached_quote(service, "US", "DE", 1.0, 10.0, ShippingService.GROUND))
+    assert global_shipping._quote_cache._locks == {}
+    assert len(global_shipping._quote_cache) == 0